@@ -2,99 +2,192 @@
 Command-line interface for Cleanarr
 """
 
-import argparse
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import argparse
+
+HELP_FLAGS = ("-h", "--help")
+
+# Fixed pieces of the candidate listing
+_SEP = "-" * 80
+_QBT_STATUS = {True: "✅ Yes", False: "❌ No (safe to delete)"}
+_QBT_UNCHECKED = "❓ Not checked (no qBittorrent connection)"
+
+# Candidate lists stored in a --candidates-file, in the order returned
+_CANDIDATE_KEYS = ("movies", "series", "episode_series")
+
+# Defaults for arguments that don't come from the config file
+_STATIC_DEFAULTS: Dict[str, Any] = {
+    "dry_run": True,
+    "delete": False,
+    "keep_files": False,
+    "add_exclusion": False,
+    "similarity_threshold": 0.8,
+    "movies_only": False,
+    "series_only": False,
+    "delete_episodes": False,
+    "log_level": "INFO",
+    "log_file": None,
+    "watched_before_days": None,
+    "candidates_file": None,
+    "refresh": False,
+}
+
+# Option -> (dest, kind) for the fast parser. kind is None for plain flags, a
+# tuple of allowed choices, or a callable converting the value. Must stay in
+# sync with setup_cli(), which remains the fallback for anything unusual.
+_SPEC: Dict[str, Tuple[str, Any]] = {
+    "--jellyfin-server": ("jellyfin_server", str),
+    "--jellyfin-api-key": ("jellyfin_api_key", str),
+    "--radarr-server": ("radarr_server", str),
+    "--radarr-api-key": ("radarr_api_key", str),
+    "--auth-username": ("auth_username", str),
+    "--auth-password": ("auth_password", str),
+    "--sonarr-server": ("sonarr_server", str),
+    "--sonarr-api-key": ("sonarr_api_key", str),
+    "--qbittorrent-server": ("qbittorrent_server", str),
+    "--qbittorrent-username": ("qbittorrent_username", str),
+    "--qbittorrent-password": ("qbittorrent_password", str),
+    "--qbittorrent-basic-auth": ("qbittorrent_basic_auth", None),
+    "--dry-run": ("dry_run", None),
+    "--delete": ("delete", None),
+    "--keep-files": ("keep_files", None),
+    "--add-exclusion": ("add_exclusion", None),
+    "--similarity-threshold": ("similarity_threshold", float),
+    "--movies-only": ("movies_only", None),
+    "--series-only": ("series_only", None),
+    "--delete-episodes": ("delete_episodes", None),
+    "--log-level": ("log_level", ("DEBUG", "INFO", "WARNING", "ERROR")),
+    "--log-file": ("log_file", str),
+    "--watched-before-days": ("watched_before_days", int),
+    "--candidates-file": ("candidates_file", str),
+    "--refresh": ("refresh", None),
+}
+
+
+def _config_defaults() -> Dict[str, Any]:
+    """Read argument defaults from the config file"""
+    from utils.config import get_config
+
+    config = get_config()
+
+    # Read each section once and resolve every default from those dicts
+    jellyfin_config = config.get_section("jellyfin")
+    radarr_config = config.get_section("radarr")
+    sonarr_config = config.get_section("sonarr")
+    qbittorrent_config = config.get_section("qbittorrent")
+    auth_config = config.get_section("auth")
+    default_username = auth_config.get("username")
+    default_password = auth_config.get("password")
+
+    return {
+        "jellyfin_server": jellyfin_config.get("server_url"),
+        "jellyfin_api_key": jellyfin_config.get("api_key"),
+        "radarr_server": radarr_config.get("server_url"),
+        "radarr_api_key": radarr_config.get("api_key"),
+        "auth_username": default_username,
+        "auth_password": default_password,
+        "sonarr_server": sonarr_config.get("server_url"),
+        "sonarr_api_key": sonarr_config.get("api_key"),
+        "qbittorrent_server": qbittorrent_config.get("server_url"),
+        "qbittorrent_username": qbittorrent_config.get("username") or default_username,
+        "qbittorrent_password": qbittorrent_config.get("password") or default_password,
+        "qbittorrent_basic_auth": (
+            qbittorrent_config.get("use_basic_auth") or "false"
+        ).lower()
+        == "true",
+    }
+
 
-from services.cleanup import CleanupService
-from services.jellyfin import JellyfinClient
-from services.qbittorrent import QbittorrentClient
-from services.radarr import RadarrClient
-from services.sonarr import SonarrClient
-from utils import logger
-from utils.config import config
+def setup_cli(help_only: bool = False) -> "argparse.ArgumentParser":
+    """Setup command-line interface
 
+    With help_only the config file is not read at all; defaults are not part
+    of the help output, so there is no point resolving them.
+    """
+    import argparse
 
-def setup_cli() -> argparse.ArgumentParser:
-    """Setup command-line interface"""
     parser = argparse.ArgumentParser(
         description="Cleanarr - Media Management Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
     # Get defaults from config
-    jellyfin_config = config.get_section("jellyfin")
-    auth_config = config.get_section("auth")
-    default_username = auth_config.get("username")
-    default_password = auth_config.get("password")
+    defaults = {} if help_only else _config_defaults()
 
     # Main cleanup arguments (no subcommands needed)
     parser.add_argument(
         "--jellyfin-server",
-        default=jellyfin_config.get("server_url"),
-        required=jellyfin_config.get("server_url") is None,
+        default=defaults.get("jellyfin_server"),
+        required=not help_only and defaults.get("jellyfin_server") is None,
         help="Jellyfin server URL",
     )
     parser.add_argument(
         "--jellyfin-api-key",
-        default=jellyfin_config.get("api_key"),
-        required=jellyfin_config.get("api_key") is None,
+        default=defaults.get("jellyfin_api_key"),
+        required=not help_only and defaults.get("jellyfin_api_key") is None,
         help="Jellyfin API key",
     )
     parser.add_argument(
         "--radarr-server",
-        default=config.get("radarr", "server_url"),
+        default=defaults.get("radarr_server"),
         help="Radarr server URL",
     )
     parser.add_argument(
         "--radarr-api-key",
-        default=config.get("radarr", "api_key"),
+        default=defaults.get("radarr_api_key"),
         help="Radarr API key",
     )
     parser.add_argument(
         "--auth-username",
-        default=default_username,
+        default=defaults.get("auth_username"),
         help="HTTP Basic auth username for Radarr/Sonarr",
     )
     parser.add_argument(
         "--auth-password",
-        default=default_password,
+        default=defaults.get("auth_password"),
         help="HTTP Basic auth password for Radarr/Sonarr",
     )
     parser.add_argument(
         "--sonarr-server",
-        default=config.get("sonarr", "server_url"),
+        default=defaults.get("sonarr_server"),
         help="Sonarr server URL",
     )
     parser.add_argument(
         "--sonarr-api-key",
-        default=config.get("sonarr", "api_key"),
+        default=defaults.get("sonarr_api_key"),
         help="Sonarr API key",
     )
     parser.add_argument(
         "--qbittorrent-server",
-        default=config.get("qbittorrent", "server_url"),
+        default=defaults.get("qbittorrent_server"),
         help="qBittorrent server URL",
     )
     parser.add_argument(
         "--qbittorrent-username",
-        default=config.get("qbittorrent", "username") or config.get("auth", "username"),
+        default=defaults.get("qbittorrent_username"),
         help="qBittorrent username",
     )
     parser.add_argument(
         "--qbittorrent-password",
-        default=config.get("qbittorrent", "password") or config.get("auth", "password"),
+        default=defaults.get("qbittorrent_password"),
         help="qBittorrent password",
     )
     parser.add_argument(
         "--qbittorrent-basic-auth",
         action="store_true",
-        default=(config.get("qbittorrent", "use_basic_auth") or "false").lower()
-        == "true",
+        default=defaults.get("qbittorrent_basic_auth", False),
         help="Use HTTP Basic Auth for qBittorrent instead of session login",
     )
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        default=True,
+        default=_STATIC_DEFAULTS["dry_run"],
         help="Show what would be deleted without actually deleting (default: true)",
     )
     parser.add_argument(
@@ -115,7 +208,7 @@ def setup_cli() -> argparse.ArgumentParser:
     parser.add_argument(
         "--similarity-threshold",
         type=float,
-        default=0.8,
+        default=_STATIC_DEFAULTS["similarity_threshold"],
         help="Minimum similarity score for matching (0.0-1.0, default: 0.8)",
     )
     parser.add_argument(
@@ -131,8 +224,8 @@ def setup_cli() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--log-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
-        default="INFO",
+        choices=_SPEC["--log-level"][1],
+        default=_STATIC_DEFAULTS["log_level"],
         help="Set logging level (default: INFO)",
     )
     parser.add_argument(
@@ -144,59 +237,210 @@ def setup_cli() -> argparse.ArgumentParser:
         type=int,
         help="Only consider content watched at least this many days ago",
     )
+    parser.add_argument(
+        "--candidates-file",
+        help="Save discovered candidates to this JSON file and reuse them on later "
+        "dry runs with the same options",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore an existing --candidates-file and rediscover candidates",
+    )
     return parser
 
 
+def _load_candidates(
+    path: Path, options: Dict[str, Any]
+) -> Optional[Tuple[List[Dict[str, Any]], ...]]:
+    """Load cached cleanup candidates if they were saved with the same options"""
+    from utils import logger
+
+    if not path.exists():
+        return None
+
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable candidates file {path}: {e}")
+        return None
+
+    try:
+        if not isinstance(data, dict):
+            raise TypeError(f"expected a JSON object, got {type(data).__name__}")
+        if data.get("options") != options:
+            logger.info(f"♻️  Candidates file {path} was built with other options")
+            return None
+        candidates = tuple(data[key] for key in _CANDIDATE_KEYS)
+        if not all(
+            isinstance(entries, list)
+            and all(isinstance(entry, dict) for entry in entries)
+            for entries in candidates
+        ):
+            raise TypeError("candidate lists must contain JSON objects")
+    except (AttributeError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring malformed candidates file {path}: {e!r}")
+        return None
+
+    return candidates
+
+
+def _save_candidates(
+    path: Path,
+    options: Dict[str, Any],
+    movies: List[Dict[str, Any]],
+    series: List[Dict[str, Any]],
+    episode_series: List[Dict[str, Any]],
+) -> None:
+    """Write cleanup candidates to a JSON file for reuse by later runs"""
+    from utils import logger
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "options": options,
+                    "movies": movies,
+                    "series": series,
+                    "episode_series": episode_series,
+                },
+                f,
+            )
+    except OSError as e:
+        logger.warning(f"Could not write candidates file {path}: {e}")
+
+
+def parse_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse arguments without argparse for the common case
+
+    Every option is a plain flag or takes a single value, so a walk over argv
+    against _SPEC is enough. Returns None for anything this doesn't handle
+    (help, unknown or abbreviated flags, bad values, missing required
+    settings), leaving the caller to fall back to setup_cli() for the usual
+    error message.
+    """
+    values = {**_config_defaults(), **_STATIC_DEFAULTS}
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        flag, sep, value = arg.partition("=")
+        if flag not in _SPEC:
+            return None
+        dest, kind = _SPEC[flag]
+
+        if kind is None:
+            if sep:
+                return None
+            values[dest] = True
+            continue
+
+        if not sep:
+            # argparse would refuse a value that looks like another option
+            if i == len(argv) or argv[i].startswith("-"):
+                return None
+            value = argv[i]
+            i += 1
+
+        if isinstance(kind, tuple):
+            if value not in kind:
+                return None
+            values[dest] = value
+            continue
+
+        try:
+            values[dest] = kind(value)
+        except ValueError:
+            return None
+
+    if values["jellyfin_server"] is None or values["jellyfin_api_key"] is None:
+        return None
+    return SimpleNamespace(**values)
+
+
+def _candidate_row(
+    entry: Dict[str, Any], arr_name: str, arr_key: str, qbt_checked: bool
+) -> str:
+    """Format one movie/series candidate for the detail listing"""
+    jellyfin_get = entry["jellyfin_item"].get
+    arr_get = entry[arr_key].get
+    row = [
+        f"  • Jellyfin: {jellyfin_get('Name', 'Unknown')} "
+        f"({jellyfin_get('ProductionYear', 'Unknown')})",
+        f"    {arr_name + ':':<9} {arr_get('title', 'Unknown')} "
+        f"({arr_get('year', 'Unknown')})",
+        f"    Match score: {entry['similarity_score']:.2f}",
+    ]
+    if arr_key == "sonarr_item":
+        fully_downloaded = entry.get("fully_downloaded", False)
+        row.append(f"    Fully downloaded: {'Yes' if fully_downloaded else 'No'}")
+    in_qbt = entry.get("in_qbittorrent", False)
+    row.append(
+        f"    In qBittorrent: {_QBT_STATUS[in_qbt] if qbt_checked else _QBT_UNCHECKED}"
+    )
+    # Trailing empty line separates entries once the rows are joined
+    row.append("")
+    return "\n".join(row)
+
+
 def handle_cleanup(args) -> int:
     """Handle cleanup command"""
+    # Service clients pull in the whole requests stack, so only import them
+    # once we know a cleanup is actually going to run
+    from concurrent.futures import ThreadPoolExecutor
+
+    from utils import logger
+
     try:
-        # Setup logging
-        from pathlib import Path
+        # Optional flags; handle_cleanup may be driven by a partial namespace
+        series_only = getattr(args, "series_only", False)
+        movies_only = getattr(args, "movies_only", False)
+        qbt_basic = getattr(args, "qbittorrent_basic_auth", False)
 
+        # Setup logging
         log_file = Path(args.log_file) if args.log_file else None
         logger.setup_logging(args.log_level, log_file)
 
         # Log configuration details (debug level - goes to file only)
-        logger.config_info(f"Jellyfin server: {args.jellyfin_server}")
-        logger.config_info(
-            f"Jellyfin API key: {args.jellyfin_api_key[:8]}..."
-            if args.jellyfin_api_key
-            else "Jellyfin API key: None"
-        )
-        logger.config_info(f"Radarr server: {args.radarr_server}")
-        logger.config_info(
-            f"Radarr API key: {args.radarr_api_key[:8]}..."
-            if args.radarr_api_key
-            else "Radarr API key: None"
-        )
-        logger.config_info(f"Sonarr server: {args.sonarr_server}")
-        logger.config_info(
-            f"Sonarr API key: {args.sonarr_api_key[:8]}..."
-            if args.sonarr_api_key
-            else "Sonarr API key: None"
-        )
-        logger.config_info(f"qBittorrent server: {args.qbittorrent_server}")
-        logger.config_info(f"qBittorrent username: {args.qbittorrent_username}")
-        logger.config_info(
-            f"qBittorrent password: {'***' if args.qbittorrent_password else 'None'}"
-        )
+        def mask_key(key: str) -> str:
+            return f"{key[:8]}..." if key else "None"
+
+        def mask_secret(secret: str) -> str:
+            return "***" if secret else "None"
+
         logger.config_info(
-            f"qBittorrent basic auth: {getattr(args, 'qbittorrent_basic_auth', False)}"
+            "\n".join(
+                [
+                    f"Jellyfin server: {args.jellyfin_server}",
+                    f"Jellyfin API key: {mask_key(args.jellyfin_api_key)}",
+                    f"Radarr server: {args.radarr_server}",
+                    f"Radarr API key: {mask_key(args.radarr_api_key)}",
+                    f"Sonarr server: {args.sonarr_server}",
+                    f"Sonarr API key: {mask_key(args.sonarr_api_key)}",
+                    f"qBittorrent server: {args.qbittorrent_server}",
+                    f"qBittorrent username: {args.qbittorrent_username}",
+                    f"qBittorrent password: {mask_secret(args.qbittorrent_password)}",
+                    f"qBittorrent basic auth: {qbt_basic}",
+                    f"Auth username: {args.auth_username}",
+                    f"Auth password: {mask_secret(args.auth_password)}",
+                ]
+            )
         )
-        logger.config_info(f"Auth username: {args.auth_username}")
-        logger.config_info(f"Auth password: {'***' if args.auth_password else 'None'}")
 
         logger.info("🚀 Starting Cleanarr cleanup process")
 
         # Initialize clients
+        from services.jellyfin import JellyfinClient
+
         jellyfin = JellyfinClient(args.jellyfin_server, args.jellyfin_api_key)
 
         radarr = None
-        if (
-            args.radarr_server
-            and args.radarr_api_key
-            and not getattr(args, "series_only", False)
-        ):
+        if args.radarr_server and args.radarr_api_key and not series_only:
+            from services.radarr import RadarrClient
+
             logger.info("🎬 Initializing Radarr client...")
             radarr = RadarrClient(
                 args.radarr_server,
@@ -204,22 +448,15 @@ def handle_cleanup(args) -> int:
                 args.auth_username,
                 args.auth_password,
             )
-            if not radarr.test_connection():
-                logger.connection_failure("Radarr", args.radarr_server)
-                radarr = None
-            else:
-                logger.connection_success("Radarr")
         else:
             logger.skip(
-                f"Radarr (server: {bool(args.radarr_server)}, api_key: {bool(args.radarr_api_key)}, series_only: {getattr(args, 'series_only', False)})"
+                f"Radarr (server: {bool(args.radarr_server)}, api_key: {bool(args.radarr_api_key)}, series_only: {series_only})"
             )
 
         sonarr = None
-        if (
-            args.sonarr_server
-            and args.sonarr_api_key
-            and not getattr(args, "movies_only", False)
-        ):
+        if args.sonarr_server and args.sonarr_api_key and not movies_only:
+            from services.sonarr import SonarrClient
+
             logger.info("📺 Initializing Sonarr client...")
             sonarr = SonarrClient(
                 args.sonarr_server,
@@ -227,14 +464,9 @@ def handle_cleanup(args) -> int:
                 args.auth_username,
                 args.auth_password,
             )
-            if not sonarr.test_connection():
-                logger.connection_failure("Sonarr", args.sonarr_server)
-                sonarr = None
-            else:
-                logger.connection_success("Sonarr")
         else:
             logger.skip(
-                f"Sonarr (server: {bool(args.sonarr_server)}, api_key: {bool(args.sonarr_api_key)}, movies_only: {getattr(args, 'movies_only', False)})"
+                f"Sonarr (server: {bool(args.sonarr_server)}, api_key: {bool(args.sonarr_api_key)}, movies_only: {movies_only})"
             )
 
         # Initialize qBittorrent client
@@ -244,81 +476,131 @@ def handle_cleanup(args) -> int:
             and args.qbittorrent_username
             and args.qbittorrent_password
         ):
+            from services.qbittorrent import QbittorrentClient
+
             logger.info("🌊 Initializing qBittorrent client...")
             qbittorrent = QbittorrentClient(
                 args.qbittorrent_server,
                 args.qbittorrent_username,
                 args.qbittorrent_password,
-                getattr(args, "qbittorrent_basic_auth", False),
+                qbt_basic,
+            )
+        else:
+            logger.skip(
+                f"qBittorrent (server: {bool(args.qbittorrent_server)}, credentials: {bool(args.qbittorrent_username and args.qbittorrent_password)})"
             )
-            if not qbittorrent.test_connection():
+
+        # Connection tests are independent round-trips, so run them concurrently
+        clients = {
+            name: client
+            for name, client in (
+                ("radarr", radarr),
+                ("sonarr", sonarr),
+                ("qbittorrent", qbittorrent),
+            )
+            if client
+        }
+        connected = {}
+        if clients:
+            with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+                futures = {
+                    name: executor.submit(client.test_connection)
+                    for name, client in clients.items()
+                }
+                connected = {name: future.result() for name, future in futures.items()}
+
+        if radarr:
+            if not connected["radarr"]:
+                logger.connection_failure("Radarr", args.radarr_server)
+                radarr = None
+            else:
+                logger.connection_success("Radarr")
+
+        if sonarr:
+            if not connected["sonarr"]:
+                logger.connection_failure("Sonarr", args.sonarr_server)
+                sonarr = None
+            else:
+                logger.connection_success("Sonarr")
+
+        if qbittorrent:
+            if not connected["qbittorrent"]:
                 logger.connection_failure("qBittorrent", args.qbittorrent_server)
                 qbittorrent = None
             else:
                 version = qbittorrent.get_version()
                 logger.connection_success("qBittorrent", f"version: {version}")
-        else:
-            logger.skip(
-                f"qBittorrent (server: {bool(args.qbittorrent_server)}, credentials: {bool(args.qbittorrent_username and args.qbittorrent_password)})"
-            )
 
         if not radarr and not sonarr:
             logger.error("No valid Radarr or Sonarr connections available")
             return 1
 
         # Initialize cleanup service
+        from services.cleanup import CleanupService
+
         cleanup_service = CleanupService(jellyfin, radarr, sonarr, qbittorrent)
 
-        logger.info("🔍 Finding cleanup candidates...")
-        (
-            movies,
-            series,
-            episode_series,
-        ) = cleanup_service.get_cleanup_candidates(
-            min_watch_age_days=args.watched_before_days,
-            collect_episode_data=args.delete_episodes,
-        )
+        # A saved candidates file is only trusted for dry runs, and only when it
+        # was built with the same discovery options and connected services
+        candidates_file = Path(args.candidates_file) if args.candidates_file else None
+        candidate_options = {
+            "watched_before_days": args.watched_before_days,
+            "delete_episodes": args.delete_episodes,
+            "radarr": bool(radarr),
+            "sonarr": bool(sonarr),
+            "qbittorrent": bool(qbittorrent),
+        }
+        cached = None
+        if candidates_file and not args.refresh and not args.delete:
+            cached = _load_candidates(candidates_file, candidate_options)
+
+        if cached:
+            logger.info(f"📂 Using cleanup candidates from {candidates_file}")
+            movies, series, episode_series = cached
+        else:
+            logger.info("🔍 Finding cleanup candidates...")
+            (
+                movies,
+                series,
+                episode_series,
+            ) = cleanup_service.get_cleanup_candidates(
+                min_watch_age_days=args.watched_before_days,
+                collect_episode_data=args.delete_episodes,
+            )
+            if candidates_file:
+                _save_candidates(
+                    candidates_file, candidate_options, movies, series, episode_series
+                )
 
-        # Filter by similarity threshold
-        movies = [
-            m for m in movies if m["similarity_score"] >= args.similarity_threshold
-        ]
-        series = [
-            s for s in series if s["similarity_score"] >= args.similarity_threshold
-        ]
+        # Filter by similarity threshold and, when qBittorrent is connected,
+        # skip content that still exists there - a single pass per media type
+        threshold = args.similarity_threshold
+
+        def filter_candidates(
+            entries: List[Dict[str, Any]],
+        ) -> Tuple[List[Dict[str, Any]], int]:
+            kept = []
+            skipped = 0
+            for entry in entries:
+                if entry["similarity_score"] < threshold:
+                    continue
+                if qbittorrent and entry.get("in_qbittorrent", False):
+                    skipped += 1
+                    continue
+                kept.append(entry)
+            return kept, skipped
+
+        movies, skipped_movies = filter_candidates(movies)
+        series, skipped_series = filter_candidates(series)
         if args.delete_episodes:
-            episode_series = [
-                s
-                for s in episode_series
-                if s["similarity_score"] >= args.similarity_threshold
-            ]
+            episode_series, skipped_episode_series = filter_candidates(episode_series)
         else:
-            episode_series = []
-
-        # Safety filter: Skip content that exists in qBittorrent
-        skipped_movies = 0
-        skipped_series = 0
-        skipped_episode_series = 0
-        if qbittorrent:
-            original_movie_count = len(movies)
-            original_series_count = len(series)
-            movies = [m for m in movies if not m.get("in_qbittorrent", False)]
-            series = [s for s in series if not s.get("in_qbittorrent", False)]
-            if episode_series:
-                original_episode_count = len(episode_series)
-                episode_series = [
-                    s for s in episode_series if not s.get("in_qbittorrent", False)
-                ]
-                skipped_episode_series = original_episode_count - len(episode_series)
-            else:
-                skipped_episode_series = 0
+            episode_series, skipped_episode_series = [], 0
 
-            skipped_movies = original_movie_count - len(movies)
-            skipped_series = original_series_count - len(series)
-            if skipped_movies > 0 or skipped_series > 0:
-                logger.info(
-                    f"🛡️ Safety filter: Skipped {skipped_movies} movies and {skipped_series} series found in qBittorrent"
-                )
+        if skipped_movies > 0 or skipped_series > 0:
+            logger.info(
+                f"🛡️ Safety filter: Skipped {skipped_movies} movies and {skipped_series} series found in qBittorrent"
+            )
         skipped_episode_series_parent = 0
         if episode_series and series:
             deleting_series_ids = {
@@ -332,9 +614,7 @@ def handle_cleanup(args) -> int:
                 for entry in episode_series
                 if entry.get("sonarr_series", {}).get("id") not in deleting_series_ids
             ]
-            skipped_episode_series_parent = (
-                original_episode_count - len(episode_series)
-            )
+            skipped_episode_series_parent = original_episode_count - len(episode_series)
         else:
             skipped_episode_series_parent = 0
 
@@ -374,62 +654,23 @@ def handle_cleanup(args) -> int:
                 print("  No content to clean up!")
             return 0
 
-        # Show details
+        # Show details - each section is assembled first and written in one go
+        qbt_checked = qbittorrent is not None
         if movies:
-            print(f"\n📽️  Movies to delete:")
-            print("-" * 80)
-            for movie_data in movies:
-                jellyfin_movie = movie_data["jellyfin_item"]
-                radarr_movie = movie_data["radarr_item"]
-                score = movie_data["similarity_score"]
-
-                jellyfin_name = jellyfin_movie.get("Name", "Unknown")
-                jellyfin_year = jellyfin_movie.get("ProductionYear", "Unknown")
-                radarr_name = radarr_movie.get("title", "Unknown")
-                radarr_year = radarr_movie.get("year", "Unknown")
-                in_qbt = movie_data.get("in_qbittorrent", False)
-
-                print(f"  • Jellyfin: {jellyfin_name} ({jellyfin_year})")
-                print(f"    Radarr:   {radarr_name} ({radarr_year})")
-                print(f"    Match score: {score:.2f}")
-                if qbittorrent:
-                    print(
-                        f"    In qBittorrent: {'✅ Yes' if in_qbt else '❌ No (safe to delete)'}"
-                    )
-                else:
-                    print(
-                        f"    In qBittorrent: ❓ Not checked (no qBittorrent connection)"
-                    )
-                print()
+            lines = ["", "📽️  Movies to delete:", _SEP]
+            lines.extend(
+                _candidate_row(movie_data, "Radarr", "radarr_item", qbt_checked)
+                for movie_data in movies
+            )
+            sys.stdout.write("\n".join(lines) + "\n")
 
         if series:
-            print(f"\n📺 Series to delete:")
-            print("-" * 80)
-            for series_data in series:
-                jellyfin_series = series_data["jellyfin_item"]
-                sonarr_series = series_data["sonarr_item"]
-                score = series_data["similarity_score"]
-                fully_downloaded = series_data.get("fully_downloaded", False)
-
-                jellyfin_name = jellyfin_series.get("Name", "Unknown")
-                jellyfin_year = jellyfin_series.get("ProductionYear", "Unknown")
-                sonarr_name = sonarr_series.get("title", "Unknown")
-                sonarr_year = sonarr_series.get("year", "Unknown")
-                in_qbt = series_data.get("in_qbittorrent", False)
-
-                print(f"  • Jellyfin: {jellyfin_name} ({jellyfin_year})")
-                print(f"    Sonarr:   {sonarr_name} ({sonarr_year})")
-                print(f"    Match score: {score:.2f}")
-                print(f"    Fully downloaded: {'Yes' if fully_downloaded else 'No'}")
-                if qbittorrent:
-                    print(
-                        f"    In qBittorrent: {'✅ Yes' if in_qbt else '❌ No (safe to delete)'}"
-                    )
-                else:
-                    print(
-                        f"    In qBittorrent: ❓ Not checked (no qBittorrent connection)"
-                    )
-                print()
+            lines = ["", "📺 Series to delete:", _SEP]
+            lines.extend(
+                _candidate_row(series_data, "Sonarr", "sonarr_item", qbt_checked)
+                for series_data in series
+            )
+            sys.stdout.write("\n".join(lines) + "\n")
 
         # Determine if this is a dry run
         dry_run = not args.delete
@@ -6,13 +6,21 @@ Entry point for the application
 
 import sys
 
-from core.cli import handle_cleanup, setup_cli
+from core.cli import HELP_FLAGS, handle_cleanup, parse_args, setup_cli
 
 
 def main():
     """Main entry point for Cleanarr - directly runs cleanup"""
-    parser = setup_cli()
-    args = parser.parse_args()
+    # Help output doesn't depend on the config, so don't load it
+    if any(arg in HELP_FLAGS for arg in sys.argv[1:]):
+        setup_cli(help_only=True).parse_args()
+        return 0
+
+    # Plain invocations skip argparse; it only handles the unusual cases
+    args = parse_args(sys.argv[1:])
+    if args is None:
+        parser = setup_cli()
+        args = parser.parse_args()
 
     # Always run cleanup since it's the only command
     return handle_cleanup(args)
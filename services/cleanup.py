@@ -3,9 +3,13 @@ Cleanup service for matching Jellyfin watched content with Radarr/Sonarr
 """
 
 import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from services.jellyfin import JellyfinClient
 from services.qbittorrent import QbittorrentClient
@@ -13,6 +17,82 @@ from services.radarr import RadarrClient
 from services.sonarr import SonarrClient
 from utils import logger
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # Fall back to difflib, same scale but slower
+    fuzz = process = None
+
+# Title normalization patterns, compiled once since matching runs them a lot
+_RE_LEADING_ARTICLE = re.compile(r"^(The|A|An)\s+", re.IGNORECASE)
+_RE_TRAILING_YEAR = re.compile(r"\s*\([^)]*\)$")
+# Special characters become spaces and whitespace collapses, in a single pass
+_RE_NONWORD_RUN = re.compile(r"\W+")
+
+# Marks a LastPlayedDate that hasn't been parsed yet (None means unparseable)
+_UNPARSED = object()
+
+# Upper bound on concurrent per-user Jellyfin requests
+_MAX_USER_WORKERS = 8
+
+# Concurrent delete requests per service
+_MAX_DELETE_WORKERS = 4
+
+# Added to the title score when the production years agree
+_YEAR_BONUS = 0.1
+
+# Titles whose known years are further apart than this are never matched
+_YEAR_WINDOW = 1
+
+# (Jellyfin ProviderIds key, Radarr/Sonarr field) pairs usable for exact matching
+_MOVIE_PROVIDER_IDS = (("Tmdb", "tmdbId"), ("Imdb", "imdbId"))
+_SERIES_PROVIDER_IDS = (("Tvdb", "tvdbId"), ("Imdb", "imdbId"), ("Tmdb", "tmdbId"))
+
+
+@lru_cache(maxsize=8192)
+def _normalize_title(title: str) -> str:
+    """Normalize title for better matching, cached per distinct title"""
+    # Remove common prefixes/suffixes and special characters
+    title = _RE_LEADING_ARTICLE.sub("", title)
+    if ")" in title:
+        title = _RE_TRAILING_YEAR.sub("", title)  # Remove year in parentheses
+    # Lowercase last: lowering can turn word characters into non-word ones
+    return _RE_NONWORD_RUN.sub(" ", title).strip().lower()
+
+
+def _episode_key(season: int, episode: int) -> int:
+    """Pack season and episode numbers into a single int dict key"""
+    return (season << 16) | episode
+
+
+def _split_by_type(
+    items: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split a mixed Jellyfin item list into movies and series"""
+    movies, series = [], []
+    for item in items:
+        item_type = item.get("Type")
+        if item_type == "Movie":
+            movies.append(item)
+        elif item_type == "Series":
+            series.append(item)
+    return movies, series
+
+
+def _ratio(norm1: str, norm2: str) -> float:
+    """Similarity of two normalized titles (0.0-1.0)"""
+    if fuzz is not None:
+        return fuzz.ratio(norm1, norm2) / 100
+    return SequenceMatcher(None, norm1, norm2).ratio()
+
+
+@dataclass
+class SeriesState:
+    """Per-series favorite and watched-episode data gathered from all users"""
+
+    has_favorites: bool = False
+    watched_episodes: List[Dict[str, Any]] = field(default_factory=list)
+    favorite_season_numbers: Set[int] = field(default_factory=set)
+
 
 class CleanupService:
     """Service to match and clean up watched content across services"""
@@ -28,91 +108,197 @@ class CleanupService:
         self.radarr = radarr
         self.sonarr = sonarr
         self.qbittorrent = qbittorrent
+        # Parsed LastPlayedDate values by raw string; episodes watched in one
+        # session often share timestamps
+        self._date_cache: Dict[str, Optional[datetime]] = {}
 
     def normalize_title(self, title: str) -> str:
         """Normalize title for better matching"""
-        # Remove common prefixes/suffixes and special characters
-        title = re.sub(r"^(The|A|An)\s+", "", title, flags=re.IGNORECASE)
-        title = re.sub(r"\s*\([^)]*\)$", "", title)  # Remove year in parentheses
-        title = re.sub(r"[^\w\s]", " ", title)  # Replace special chars with spaces
-        title = re.sub(r"\s+", " ", title).strip().lower()  # Normalize whitespace
-        return title
+        return _normalize_title(title)
 
     def calculate_similarity(self, title1: str, title2: str) -> float:
         """Calculate similarity between two titles"""
-        norm1 = self.normalize_title(title1)
-        norm2 = self.normalize_title(title2)
-        return SequenceMatcher(None, norm1, norm2).ratio()
+        return _ratio(_normalize_title(title1), _normalize_title(title2))
 
-    def find_matching_movie(
+    def normalize_titles(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Normalize the titles of Radarr/Sonarr items, in order"""
+        return [_normalize_title(item.get("title", "")) for item in items]
+
+    def _find_best_match(
         self,
-        jellyfin_movie: Dict[str, Any],
-        radarr_movies: List[Dict[str, Any]],
-        threshold: float = 0.8,
-    ) -> Optional[Dict[str, Any]]:
-        """Find matching movie in Radarr based on Jellyfin movie"""
-        jellyfin_title = jellyfin_movie.get("Name", "")
-        jellyfin_year = jellyfin_movie.get("ProductionYear")
+        title: str,
+        year: Optional[int],
+        candidates: List[Dict[str, Any]],
+        threshold: float,
+        norm_titles: Optional[List[str]] = None,
+        year_window: Optional[int] = _YEAR_WINDOW,
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Find the Radarr/Sonarr item with the best title score plus year bonus
+
+        Returns the item with its title score (without the bonus). When both
+        years are known and differ by more than year_window, the candidate is
+        not considered at all; None disables the check.
+        """
+        norm_title = _normalize_title(title)
+        if norm_titles is None:
+            norm_titles = self.normalize_titles(candidates)
+
+        def outside_year_window(candidate: Dict[str, Any]) -> bool:
+            candidate_year = candidate.get("year")
+            return bool(
+                year_window is not None
+                and year
+                and candidate_year
+                and abs(year - candidate_year) > year_window
+            )
+
+        if process is not None:
+            # Score every candidate in one call; anything that can't reach the
+            # threshold even with the year bonus is dropped on the C side
+            cutoff = max((threshold - _YEAR_BONUS) * 100 - 1e-6, 0)
+            scored = sorted(
+                (index, score / 100)
+                for _, score, index in process.extract(
+                    norm_title,
+                    norm_titles,
+                    scorer=fuzz.ratio,
+                    score_cutoff=cutoff,
+                    limit=None,
+                )
+            )
+        else:
+            # quick_ratio bounds ratio from above, so pairs that can't reach
+            # the threshold even with the year bonus skip the full comparison.
+            # Scores are produced lazily so an early exit below saves them too.
+            cutoff = threshold - _YEAR_BONUS - 1e-9
+            matcher = SequenceMatcher(None, norm_title)
+
+            def score_candidates() -> Iterable[Tuple[int, float]]:
+                for index, norm in enumerate(norm_titles):
+                    if outside_year_window(candidates[index]):
+                        continue
+                    matcher.set_seq2(norm)
+                    if (
+                        matcher.real_quick_ratio() < cutoff
+                        or matcher.quick_ratio() < cutoff
+                    ):
+                        continue
+                    yield index, matcher.ratio()
+
+            scored = score_candidates()
 
         best_match = None
         best_score = 0.0
-
-        for radarr_movie in radarr_movies:
-            radarr_title = radarr_movie.get("title", "")
-            radarr_year = radarr_movie.get("year")
-
-            # Calculate title similarity
-            title_score = self.calculate_similarity(jellyfin_title, radarr_title)
+        best_title_score = 0.0
+        # Nothing can beat an identical title (with the year bonus if a year is
+        # known), and ties keep the earlier candidate, so stop there
+        best_possible = 1.0 + (_YEAR_BONUS if year else 0)
+
+        for index, title_score in scored:
+            candidate = candidates[index]
+            if outside_year_window(candidate):
+                continue
+            candidate_year = candidate.get("year")
 
             # Boost score if years match
             year_bonus = (
-                0.1
-                if jellyfin_year and radarr_year and jellyfin_year == radarr_year
-                else 0
+                _YEAR_BONUS if year and candidate_year and year == candidate_year else 0
             )
 
             total_score = title_score + year_bonus
 
             if total_score > best_score and total_score >= threshold:
                 best_score = total_score
-                best_match = radarr_movie
+                best_title_score = title_score
+                best_match = candidate
+                if best_score >= best_possible:
+                    break
+
+        if best_match is None:
+            return None
+        return best_match, best_title_score
+
+    def _build_match_index(
+        self,
+        items: List[Dict[str, Any]],
+        provider_ids: Tuple[Tuple[str, str], ...],
+    ) -> Dict[Tuple[Any, ...], Dict[str, Any]]:
+        """Index Radarr/Sonarr items by provider id and normalized title/year"""
+        index: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+        # setdefault keeps the first item per key, like the fuzzy matcher does
+        for item in items:
+            for provider, id_field in provider_ids:
+                value = item.get(id_field)
+                if value:
+                    index.setdefault((provider, str(value)), item)
+            norm = _normalize_title(item.get("title", ""))
+            year = item.get("year")
+            if year:
+                index.setdefault((norm, year), item)
+            index.setdefault((norm,), item)
+        return index
+
+    def _find_exact_match(
+        self,
+        jellyfin_item: Dict[str, Any],
+        index: Dict[Tuple[Any, ...], Dict[str, Any]],
+        provider_ids: Tuple[Tuple[str, str], ...],
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Look up a Jellyfin item in a match index, None if fuzzy matching is needed"""
+        norm = _normalize_title(jellyfin_item.get("Name", ""))
+        jellyfin_ids = jellyfin_item.get("ProviderIds") or {}
+        for provider, _ in provider_ids:
+            value = jellyfin_ids.get(provider)
+            if value:
+                match = index.get((provider, str(value)))
+                if match:
+                    return match, _ratio(norm, _normalize_title(match.get("title", "")))
+
+        # Same normalized title and year is the best score fuzzy matching can
+        # give. Without a year no candidate gets the bonus, so the title alone
+        # decides; with one, a title-only hit could still tie with a near
+        # match that has the year bonus, so leave that to the fuzzy matcher.
+        year = jellyfin_item.get("ProductionYear")
+        match = index.get((norm, year) if year else (norm,))
+        if match is None:
+            return None
+        return match, 1.0
 
-        return best_match
+    def find_matching_movie(
+        self,
+        jellyfin_movie: Dict[str, Any],
+        radarr_movies: List[Dict[str, Any]],
+        threshold: float = 0.8,
+        norm_titles: Optional[List[str]] = None,
+        year_window: Optional[int] = _YEAR_WINDOW,
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Find matching movie in Radarr, with its title similarity score"""
+        return self._find_best_match(
+            jellyfin_movie.get("Name", ""),
+            jellyfin_movie.get("ProductionYear"),
+            radarr_movies,
+            threshold,
+            norm_titles,
+            year_window,
+        )
 
     def find_matching_series(
         self,
         jellyfin_series: Dict[str, Any],
         sonarr_series: List[Dict[str, Any]],
         threshold: float = 0.8,
-    ) -> Optional[Dict[str, Any]]:
-        """Find matching series in Sonarr based on Jellyfin series"""
-        jellyfin_title = jellyfin_series.get("Name", "")
-        jellyfin_year = jellyfin_series.get("ProductionYear")
-
-        best_match = None
-        best_score = 0.0
-
-        for sonarr_show in sonarr_series:
-            sonarr_title = sonarr_show.get("title", "")
-            sonarr_year = sonarr_show.get("year")
-
-            # Calculate title similarity
-            title_score = self.calculate_similarity(jellyfin_title, sonarr_title)
-
-            # Boost score if years match
-            year_bonus = (
-                0.1
-                if jellyfin_year and sonarr_year and jellyfin_year == sonarr_year
-                else 0
-            )
-
-            total_score = title_score + year_bonus
-
-            if total_score > best_score and total_score >= threshold:
-                best_score = total_score
-                best_match = sonarr_show
-
-        return best_match
+        norm_titles: Optional[List[str]] = None,
+        year_window: Optional[int] = _YEAR_WINDOW,
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Find matching series in Sonarr, with its title similarity score"""
+        return self._find_best_match(
+            jellyfin_series.get("Name", ""),
+            jellyfin_series.get("ProductionYear"),
+            sonarr_series,
+            threshold,
+            norm_titles,
+            year_window,
+        )
 
     def _is_favorite(self, item: Dict[str, Any]) -> bool:
         """Check if an item is marked as favorite in Jellyfin"""
@@ -126,20 +312,23 @@ class CleanupService:
         if not date_str:
             return None
 
-        try:
-            trimmed = date_str.rstrip("Z")
-            if "." in trimmed:
-                main, fraction = trimmed.split(".", 1)
-            else:
-                main, fraction = trimmed, "0"
+        cached = self._date_cache.get(date_str, _UNPARSED)
+        if cached is not _UNPARSED:
+            return cached
 
-            fraction = (fraction + "000000")[:6]
-            normalized = f"{main}.{fraction}"
-            parsed = datetime.strptime(normalized, "%Y-%m-%dT%H:%M:%S.%f")
-            return parsed.replace(tzinfo=timezone.utc)
+        try:
+            # Jellyfin sends UTC with 7 fractional digits and a "Z" suffix;
+            # fromisoformat only takes 3 or 6 digits and no "Z" before 3.11
+            main, _, fraction = date_str.rstrip("Z").partition(".")
+            parsed = datetime.fromisoformat(f"{main}.{(fraction + '000000')[:6]}")
+            if not parsed.tzinfo:
+                parsed = parsed.replace(tzinfo=timezone.utc)
         except Exception:
-            logger.debug(f"Unable to parse LastPlayedDate: {date_str}")
-            return None
+            logger.debug("Unable to parse LastPlayedDate: %s", date_str)
+            parsed = None
+
+        self._date_cache[date_str] = parsed
+        return parsed
 
     def _filter_by_watch_age(
         self, items: List[Dict[str, Any]], min_age_days: int, label: str
@@ -148,128 +337,181 @@ class CleanupService:
         cutoff = datetime.now(timezone.utc) - timedelta(days=min_age_days)
         filtered: List[Dict[str, Any]] = []
         skipped = 0
+        parse_last_played = self._parse_last_played
 
         for item in items:
-            last_played = self._parse_last_played(item)
+            last_played = parse_last_played(item)
             if last_played and last_played <= cutoff:
                 filtered.append(item)
             else:
                 skipped += 1
 
+        self._log_too_recent(skipped, min_age_days, label)
+
+        return filtered
+
+    def _log_too_recent(self, skipped: int, min_age_days: int, label: str) -> None:
+        """Report items dropped by the watch age filter"""
         if skipped:
             logger.info(
                 f"⏳ Skipped {skipped} {label} newer than {min_age_days} days (or missing watch date)"
             )
 
-        return filtered
+    def _select_watched(
+        self,
+        items: Iterable[Dict[str, Any]],
+        kind: str,
+        cutoff: Optional[datetime],
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """Dedupe watched items and drop favorites and ones watched after cutoff
+
+        Returns the kept items plus the number of favorites and too recent
+        items. An item listed by several users keeps its first position and
+        the data of the last user listing it, and is a favorite if any of
+        those users marked it as one.
+        """
+        is_favorite = self._is_favorite
+        latest: Dict[Any, Dict[str, Any]] = {}
+        favorite_ids: Set[Any] = set()
+        for item in items:
+            item_id = item.get("Id")
+            latest[item_id] = item
+            if is_favorite(item):
+                favorite_ids.add(item_id)
+
+        kept = []
+        favorites = too_recent = 0
+        parse_last_played = self._parse_last_played
+        for item_id, item in latest.items():
+            if item_id in favorite_ids:
+                favorites += 1
+                logger.debug(
+                    "Skipping favorite %s: %s", kind, item.get("Name", "Unknown")
+                )
+                continue
+            if cutoff is not None:
+                last_played = parse_last_played(item)
+                if not last_played or last_played > cutoff:
+                    too_recent += 1
+                    continue
+            kept.append(item)
 
-    def _collect_watched_episodes_for_series(
+        return kept, favorites, too_recent
+
+    def _map_users(self, fetch: Callable[[str], Any], user_ids: List[str]) -> List[Any]:
+        """Run a per-user Jellyfin fetch concurrently, results in user order"""
+        if len(user_ids) <= 1:
+            return [fetch(user_id) for user_id in user_ids]
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_USER_WORKERS, len(user_ids))
+        ) as executor:
+            return list(executor.map(fetch, user_ids))
+
+    def _collect_series_state(
         self,
-        users: List[Dict[str, Any]],
+        user_ids: List[str],
         jellyfin_series: Dict[str, Any],
         min_watch_age_days: Optional[int],
-    ) -> List[Dict[str, Any]]:
-        """Collect watched Jellyfin episodes for the provided series from all users"""
+        collect_episodes: bool,
+    ) -> SeriesState:
+        """Fetch favorite and watched-episode data for a series from all users
+
+        Favorite episodes/seasons decide whether the whole series is protected,
+        and favorite seasons are also needed to filter watched episodes, so
+        everything is fetched in one pass per user.
+        """
+        state = SeriesState()
         series_id = jellyfin_series.get("Id")
         if not series_id:
-            return []
+            return state
 
-        episodes_by_id: Dict[str, Dict[str, Any]] = {}
-        favorite_episodes = 0
-        favorite_season_numbers = set()
+        series_name = jellyfin_series.get("Name", "Unknown")
+
+        jellyfin = self.jellyfin
+        get_favorite_episodes = jellyfin.get_favorite_episodes_for_series
+        get_favorite_seasons = jellyfin.get_favorite_seasons_for_series
+        get_watched_episodes = jellyfin.get_watched_episodes_for_series
 
-        for user in users:
-            user_id = user["Id"]
+        def fetch(user_id: str):
             try:
-                watched_episodes = self.jellyfin.get_watched_episodes_for_series(
-                    user_id, series_id
-                )
-                favorite_seasons = self.jellyfin.get_favorite_seasons_for_series(
-                    user_id, series_id
+                return (
+                    get_favorite_episodes(user_id, series_id),
+                    get_favorite_seasons(user_id, series_id),
+                    (
+                        get_watched_episodes(user_id, series_id)
+                        if collect_episodes
+                        else []
+                    ),
                 )
             except Exception as exc:
                 logger.error(
-                    f"Error fetching watched episodes for {jellyfin_series.get('Name', 'Unknown')} (user {user_id}): {exc}"
+                    f"Error fetching episode data for {series_name} (user {user_id}): {exc}"
                 )
-                continue
+                return None
+
+        episodes_by_id: Dict[str, Dict[str, Any]] = {}
+        favorite_episodes = 0
+
+        results = [
+            result for result in self._map_users(fetch, user_ids) if result is not None
+        ]
+
+        # Gather every user's favorites before looking at any watched episode,
+        # so a favorite from one user also protects other users' copies
+        favorite_episode_ids = set()
+        for favorites, favorite_seasons, _ in results:
+            if favorites or favorite_seasons:
+                state.has_favorites = True
+
+            for episode in favorites:
+                favorite_episode_ids.add(episode.get("Id"))
 
             for season in favorite_seasons:
                 number = season.get("IndexNumber")
                 if number is not None:
-                    favorite_season_numbers.add(number)
+                    state.favorite_season_numbers.add(number)
 
+        favorite_season_numbers = state.favorite_season_numbers
+        is_favorite = self._is_favorite
+        for _, _, watched_episodes in results:
             for episode in watched_episodes:
-                season_number = episode.get("ParentIndexNumber")
-                if self._is_favorite(episode) or (
-                    season_number in favorite_season_numbers
+                episode_get = episode.get
+                episode_id = episode_get("Id")
+                if (
+                    is_favorite(episode)
+                    or episode_id in favorite_episode_ids
+                    or episode_get("ParentIndexNumber") in favorite_season_numbers
                 ):
                     favorite_episodes += 1
                     continue
-                episodes_by_id[episode.get("Id")] = episode
+                episodes_by_id[episode_id] = episode
 
         if favorite_episodes:
             logger.info(
-                f"🌟 Protected favorite episodes: {favorite_episodes} for {jellyfin_series.get('Name', 'Unknown')}"
+                f"🌟 Protected favorite episodes: {favorite_episodes} for {series_name}"
             )
 
         episodes = list(episodes_by_id.values())
-        if (
-            min_watch_age_days is not None
-            and min_watch_age_days >= 0
-            and episodes
-        ):
+        if min_watch_age_days is not None and min_watch_age_days >= 0 and episodes:
             episodes = self._filter_by_watch_age(
-                episodes,
-                min_watch_age_days,
-                f"episodes for {jellyfin_series.get('Name', 'Unknown')}",
+                episodes, min_watch_age_days, f"episodes for {series_name}"
             )
+        state.watched_episodes = episodes
 
-        return episodes
-
-    def _series_has_favorite_content(
-        self, users: List[Dict[str, Any]], jellyfin_series: Dict[str, Any]
-    ) -> bool:
-        """Determine if any user has favorited episodes or seasons in this series"""
-        series_id = jellyfin_series.get("Id")
-        if not series_id:
-            return False
-
-        for user in users:
-            user_id = user["Id"]
-            try:
-                favorites = self.jellyfin.get_favorite_episodes_for_series(
-                    user_id, series_id
-                )
-                seasons = self.jellyfin.get_favorite_seasons_for_series(
-                    user_id, series_id
-                )
-            except Exception as exc:
-                logger.error(
-                    f"Error fetching favorite sub-items for {jellyfin_series.get('Name', 'Unknown')} (user {user_id}): {exc}"
-                )
-                continue
-
-            if favorites or seasons:
-                return True
-
-        return False
+        return state
 
     def _build_episode_cleanup_entry(
         self,
-        users: List[Dict[str, Any]],
         jellyfin_series: Dict[str, Any],
         sonarr_series: Dict[str, Any],
+        jellyfin_episodes: List[Dict[str, Any]],
         similarity_score: float,
-        min_watch_age_days: Optional[int],
         in_qbittorrent: bool,
     ) -> Optional[Dict[str, Any]]:
         """Build cleanup data for watched episodes in a series"""
         if not self.sonarr:
             return None
 
-        jellyfin_episodes = self._collect_watched_episodes_for_series(
-            users, jellyfin_series, min_watch_age_days
-        )
         if not jellyfin_episodes:
             return None
 
@@ -281,29 +523,41 @@ class CleanupService:
             )
             return None
 
+        # Keyed by packed season/episode number; entries missing either number
+        # can never be looked up, so they are left out
         sonarr_episode_map = {}
         for episode in sonarr_episodes:
-            key = (episode.get("seasonNumber"), episode.get("episodeNumber"))
-            sonarr_episode_map[key] = episode
+            season = episode.get("seasonNumber")
+            number = episode.get("episodeNumber")
+            if season is not None and number is not None:
+                sonarr_episode_map[_episode_key(season, number)] = episode
 
         matched_episodes = []
+        # Bound once, this loop runs for every watched episode of the series
+        find_sonarr_episode = sonarr_episode_map.get
+        add_match = matched_episodes.append
         for episode in jellyfin_episodes:
-            season = episode.get("ParentIndexNumber")
-            number = episode.get("IndexNumber")
+            episode_get = episode.get
+            season = episode_get("ParentIndexNumber")
+            number = episode_get("IndexNumber")
             if season is None or number is None:
                 logger.debug(
-                    f"Skipping episode without season/episode numbers: {episode.get('Name', 'Unknown')}"
+                    "Skipping episode without season/episode numbers: %s",
+                    episode_get("Name", "Unknown"),
                 )
                 continue
 
-            sonarr_episode = sonarr_episode_map.get((season, number))
+            sonarr_episode = find_sonarr_episode(_episode_key(season, number))
             if not sonarr_episode:
                 logger.debug(
-                    f"No Sonarr episode match for {jellyfin_series.get('Name', 'Unknown')} S{season:02}E{number:02}"
+                    "No Sonarr episode match for %s S%02dE%02d",
+                    jellyfin_series.get("Name", "Unknown"),
+                    season,
+                    number,
                 )
                 continue
 
-            matched_episodes.append(
+            add_match(
                 {
                     "jellyfin_episode": episode,
                     "sonarr_episode": sonarr_episode,
@@ -334,7 +588,17 @@ class CleanupService:
         cleanup_series = []
         episode_cleanup = []
 
+        # The Radarr/Sonarr libraries don't depend on anything from Jellyfin,
+        # so fetch them while the watched items are being collected
+        prefetch = ThreadPoolExecutor(max_workers=2)
+        radarr_future = prefetch.submit(self.radarr.get_movies) if self.radarr else None
+        sonarr_future = prefetch.submit(self.sonarr.get_series) if self.sonarr else None
+
         try:
+            # Torrents may have changed since a previous run on this client
+            if self.qbittorrent:
+                self.qbittorrent.clear_cache()
+
             # Get all users
             try:
                 users = self.jellyfin.get_users()
@@ -342,77 +606,57 @@ class CleanupService:
                 # Fall back to current user if no admin access
                 users = [self.jellyfin.get_current_user()]
 
-            # Get watched content for all users
-            all_watched_movies = []
-            all_watched_series = []
-
-            for user in users:
-                user_id = user["Id"]
-                watched_movies = self.jellyfin.get_watched_items(user_id, ["Movie"])
-                watched_series = self.jellyfin.get_watched_items(user_id, ["Series"])
-
-                all_watched_movies.extend(watched_movies)
-                all_watched_series.extend(watched_series)
-
-            # Remove duplicates (same item watched by multiple users)
-            unique_movies = {
-                item.get("Id"): item for item in all_watched_movies
-            }.values()
-            unique_series = {
-                item.get("Id"): item for item in all_watched_series
-            }.values()
-
-            # Filter out favorites
-            non_favorite_movies = []
-            favorite_movies = 0
-            for movie in unique_movies:
-                if self._is_favorite(movie):
-                    favorite_movies += 1
-                    logger.debug(
-                        f"Skipping favorite movie: {movie.get('Name', 'Unknown')}"
-                    )
-                else:
-                    non_favorite_movies.append(movie)
-
-            non_favorite_series = []
-            favorite_series = 0
-            for series in unique_series:
-                if self._is_favorite(series):
-                    favorite_series += 1
-                    logger.debug(
-                        f"Skipping favorite series: {series.get('Name', 'Unknown')}"
-                    )
-                else:
-                    non_favorite_series.append(series)
+            user_ids = [user["Id"] for user in users]
 
-            if favorite_movies > 0 or favorite_series > 0:
-                logger.info(
-                    f"🌟 Protected favorites: {favorite_movies} movies, {favorite_series} series"
+            # Get watched content for all users, one request per user for both
+            # types. Favorites are kept in the results so that one user's
+            # favorite protects the item from the others' copies too.
+            def fetch_watched(user_id: str):
+                return _split_by_type(
+                    self.jellyfin.get_watched_items(user_id, ["Movie", "Series"])
                 )
 
-            unique_movies = non_favorite_movies
-            unique_series = non_favorite_series
+            watched = self._map_users(fetch_watched, user_ids)
 
+            cutoff = None
             if min_watch_age_days is not None and min_watch_age_days >= 0:
-                unique_movies = list(unique_movies)
-                unique_series = list(unique_series)
-                unique_movies = self._filter_by_watch_age(
-                    unique_movies, min_watch_age_days, "movies"
-                )
-                unique_series = self._filter_by_watch_age(
-                    unique_series, min_watch_age_days, "series"
+                cutoff = datetime.now(timezone.utc) - timedelta(days=min_watch_age_days)
+
+            # Remove duplicates (same item watched by multiple users), favorites
+            # and recently watched items in one pass per type
+            unique_movies, favorite_movies, recent_movies = self._select_watched(
+                chain.from_iterable(movies for movies, _ in watched), "movie", cutoff
+            )
+            unique_series, favorite_series, recent_series = self._select_watched(
+                chain.from_iterable(series for _, series in watched), "series", cutoff
+            )
+
+            if favorite_movies > 0 or favorite_series > 0:
+                logger.info(
+                    f"🌟 Protected favorites: {favorite_movies} movies, {favorite_series} series"
                 )
 
+            if cutoff is not None:
+                self._log_too_recent(recent_movies, min_watch_age_days, "movies")
+                self._log_too_recent(recent_series, min_watch_age_days, "series")
+
             # Match with Radarr movies
-            if self.radarr:
-                radarr_movies = self.radarr.get_movies()
+            if radarr_future:
+                radarr_movies = radarr_future.result()
+                radarr_index = self._build_match_index(
+                    radarr_movies, _MOVIE_PROVIDER_IDS
+                )
+                radarr_titles = self.normalize_titles(radarr_movies)
 
                 for jellyfin_movie in unique_movies:
-                    radarr_match = self.find_matching_movie(
-                        jellyfin_movie, radarr_movies
+                    match = self._find_exact_match(
+                        jellyfin_movie, radarr_index, _MOVIE_PROVIDER_IDS
+                    ) or self.find_matching_movie(
+                        jellyfin_movie, radarr_movies, norm_titles=radarr_titles
                     )
 
-                    if radarr_match:
+                    if match:
+                        radarr_match, similarity = match
                         movie_title = jellyfin_movie.get("Name", "")
                         movie_year = jellyfin_movie.get("ProductionYear")
 
@@ -427,26 +671,30 @@ class CleanupService:
                             {
                                 "jellyfin_item": jellyfin_movie,
                                 "radarr_item": radarr_match,
-                                "similarity_score": self.calculate_similarity(
-                                    movie_title, radarr_match.get("title", "")
-                                ),
+                                "similarity_score": similarity,
                                 "in_qbittorrent": in_qbittorrent,
                             }
                         )
 
             # Match with Sonarr series
             protected_by_favorite_episodes = 0
-            if self.sonarr:
-                sonarr_series = self.sonarr.get_series()
+            if sonarr_future:
+                sonarr_series = sonarr_future.result()
+                sonarr_index = self._build_match_index(
+                    sonarr_series, _SERIES_PROVIDER_IDS
+                )
+                sonarr_titles = self.normalize_titles(sonarr_series)
                 for jellyfin_show in unique_series:
-                    sonarr_match = self.find_matching_series(
-                        jellyfin_show, sonarr_series
+                    match = self._find_exact_match(
+                        jellyfin_show, sonarr_index, _SERIES_PROVIDER_IDS
+                    ) or self.find_matching_series(
+                        jellyfin_show, sonarr_series, norm_titles=sonarr_titles
                     )
 
-                    if sonarr_match:
+                    if match:
+                        sonarr_match, similarity = match
                         series_title = jellyfin_show.get("Name", "")
                         series_year = jellyfin_show.get("ProductionYear")
-                        series_id = sonarr_match.get("id")
 
                         # Check if series exists in qBittorrent (if qBittorrent client available)
                         in_qbittorrent = False
@@ -455,21 +703,20 @@ class CleanupService:
                                 series_title, series_year
                             )
 
-                        similarity = self.calculate_similarity(
-                            series_title, sonarr_match.get("title", "")
-                        )
-                        has_favorite_episodes = self._series_has_favorite_content(
-                            users, jellyfin_show
+                        collect_episodes = collect_episode_data and not in_qbittorrent
+                        series_state = self._collect_series_state(
+                            user_ids,
+                            jellyfin_show,
+                            min_watch_age_days,
+                            collect_episodes,
                         )
+                        has_favorite_episodes = series_state.has_favorites
                         series_entry = {
                             "jellyfin_item": jellyfin_show,
                             "sonarr_item": sonarr_match,
                             "similarity_score": similarity,
-                            "fully_downloaded": (
-                                self.sonarr.is_series_fully_watched(series_id)
-                                if series_id
-                                else False
-                            ),
+                            # Filled in below for the series that get deleted
+                            "fully_downloaded": False,
                             "in_qbittorrent": in_qbittorrent,
                             "favorite_episodes": has_favorite_episodes,
                         }
@@ -477,23 +724,35 @@ class CleanupService:
                         if has_favorite_episodes:
                             protected_by_favorite_episodes += 1
                             logger.debug(
-                                f"Skipping full series deletion for {series_title} due to favorite episodes"
+                                "Skipping full series deletion for %s due to favorite episodes",
+                                series_title,
                             )
                         else:
                             cleanup_series.append(series_entry)
 
-                        if collect_episode_data and not in_qbittorrent:
+                        if collect_episodes:
                             episode_entry = self._build_episode_cleanup_entry(
-                                users,
                                 jellyfin_show,
                                 sonarr_match,
+                                series_state.watched_episodes,
                                 similarity,
-                                min_watch_age_days,
                                 in_qbittorrent,
                             )
                             if episode_entry:
                                 episode_cleanup.append(episode_entry)
 
+                # One episode list request per series, run concurrently
+                series_ids = [
+                    entry["sonarr_item"].get("id")
+                    for entry in cleanup_series
+                    if entry["sonarr_item"].get("id")
+                ]
+                fully_downloaded = self.sonarr.are_series_fully_watched(series_ids)
+                for entry in cleanup_series:
+                    entry["fully_downloaded"] = fully_downloaded.get(
+                        entry["sonarr_item"].get("id"), False
+                    )
+
             if protected_by_favorite_episodes > 0:
                 logger.info(
                     f"🌟 Favorite episodes protected: {protected_by_favorite_episodes} series"
@@ -501,9 +760,75 @@ class CleanupService:
 
         except Exception as e:
             logger.error(f"Error getting cleanup candidates: {e}")
+        finally:
+            # Nothing to wait for if an earlier step failed
+            prefetch.shutdown(wait=False)
 
         return cleanup_movies, cleanup_series, episode_cleanup
 
+    def _delete_episode(
+        self,
+        episode_label: str,
+        jellyfin_episode: Dict[str, Any],
+        sonarr_episode: Dict[str, Any],
+    ) -> Tuple[bool, Optional[str]]:
+        """Delete an episode in Jellyfin and unmonitor it in Sonarr"""
+        try:
+            self.jellyfin.delete_item(jellyfin_episode.get("Id"))
+            unmonitored = self.sonarr.set_single_episode_monitored(
+                sonarr_episode.get("id"), False
+            )
+            if not unmonitored:
+                logger.warning(
+                    f"Episode deleted but failed to update Sonarr monitoring: {episode_label}"
+                )
+
+            logger.success(f"Episode deleted: {episode_label}")
+            return True, None
+
+        except Exception as e:
+            error_msg = f"Error deleting episode {episode_label}: {e}"
+            logger.error(error_msg)
+            return False, error_msg
+
+    def _delete_movie(
+        self, movie_id: int, movie_title: str, delete_files: bool, add_exclusion: bool
+    ) -> Tuple[bool, Optional[str]]:
+        """Delete a movie from Radarr"""
+        try:
+            success = self.radarr.delete_movie(movie_id, delete_files, add_exclusion)
+            if success:
+                logger.success(f"Movie deleted: {movie_title}")
+            else:
+                logger.failure(f"Movie deletion failed: {movie_title}")
+            return success, None
+
+        except Exception as e:
+            error_msg = f"Error deleting movie {movie_title}: {e}"
+            logger.error(error_msg)
+            return False, error_msg
+
+    def _delete_series(
+        self,
+        series_id: int,
+        series_title: str,
+        delete_files: bool,
+        add_exclusion: bool,
+    ) -> Tuple[bool, Optional[str]]:
+        """Delete a series from Sonarr"""
+        try:
+            success = self.sonarr.delete_series(series_id, delete_files, add_exclusion)
+            if success:
+                logger.success(f"Series deleted: {series_title}")
+            else:
+                logger.failure(f"Series deletion failed: {series_title}")
+            return success, None
+
+        except Exception as e:
+            error_msg = f"Error deleting series {series_title}: {e}"
+            logger.error(error_msg)
+            return False, error_msg
+
     def execute_cleanup(
         self,
         movies: List[Dict[str, Any]],
@@ -525,42 +850,53 @@ class CleanupService:
             "errors": [],
         }
 
-        # Delete individual episodes if requested
-        if delete_episodes and episode_series:
-            if not self.sonarr:
-                logger.warning(
-                    "Episode deletion requested but Sonarr client is unavailable"
-                )
-            elif not self.jellyfin:
-                logger.warning(
-                    "Episode deletion requested but Jellyfin client is unavailable"
-                )
-            else:
-                for series_entry in episode_series:
-                    jellyfin_series = series_entry.get("jellyfin_series", {})
-                    sonarr_series = series_entry.get("sonarr_series", {})
-                    series_title = jellyfin_series.get("Name", sonarr_series.get("title", "Unknown"))
-                    episodes = series_entry.get("episodes", [])
-
-                    for episode in episodes:
-                        jellyfin_episode = episode.get("jellyfin_episode", {})
-                        sonarr_episode = episode.get("sonarr_episode", {})
-                        season_number = episode.get("season_number")
-                        episode_number = episode.get("episode_number")
-
-                        season_str = (
-                            f"S{int(season_number):02d}"
-                            if isinstance(season_number, int)
-                            else "S??"
-                        )
-                        episode_str = (
-                            f"E{int(episode_number):02d}"
-                            if isinstance(episode_number, int)
-                            else "E??"
+        # Deletes have no ordering between them, so each service gets its own
+        # small pool; a slow server then doesn't hold up the others. Dry runs
+        # only log and count, so they never start a pool.
+        executors: Dict[str, ThreadPoolExecutor] = {}
+        pending: List[Tuple[str, Future]] = []
+
+        def submit(service: str, kind: str, fn: Callable, *args: Any) -> None:
+            if service not in executors:
+                executors[service] = ThreadPoolExecutor(max_workers=_MAX_DELETE_WORKERS)
+            pending.append((kind, executors[service].submit(fn, *args)))
+
+        try:
+            # Delete individual episodes if requested
+            if delete_episodes and episode_series:
+                if not self.sonarr:
+                    logger.warning(
+                        "Episode deletion requested but Sonarr client is unavailable"
+                    )
+                elif not self.jellyfin:
+                    logger.warning(
+                        "Episode deletion requested but Jellyfin client is unavailable"
+                    )
+                else:
+                    for series_entry in episode_series:
+                        jellyfin_series = series_entry.get("jellyfin_series", {})
+                        sonarr_series = series_entry.get("sonarr_series", {})
+                        series_title = jellyfin_series.get(
+                            "Name", sonarr_series.get("title", "Unknown")
                         )
-                        episode_label = f"{series_title} {season_str}{episode_str}"
+                        episodes = series_entry.get("episodes", [])
+
+                        for episode in episodes:
+                            season_number = episode.get("season_number")
+                            episode_number = episode.get("episode_number")
+
+                            season_str = (
+                                f"S{int(season_number):02d}"
+                                if isinstance(season_number, int)
+                                else "S??"
+                            )
+                            episode_str = (
+                                f"E{int(episode_number):02d}"
+                                if isinstance(episode_number, int)
+                                else "E??"
+                            )
+                            episode_label = f"{series_title} {season_str}{episode_str}"
 
-                        try:
                             if dry_run:
                                 logger.info(
                                     f"[DRY RUN] Would delete episode: {episode_label}"
@@ -568,82 +904,69 @@ class CleanupService:
                                 results["episodes_deleted"] += 1
                                 continue
 
-                            self.jellyfin.delete_item(jellyfin_episode.get("Id"))
-                            unmonitored = self.sonarr.set_single_episode_monitored(
-                                sonarr_episode.get("id"), False
+                            submit(
+                                "jellyfin",
+                                "episodes",
+                                self._delete_episode,
+                                episode_label,
+                                episode.get("jellyfin_episode", {}),
+                                episode.get("sonarr_episode", {}),
                             )
-                            if not unmonitored:
-                                logger.warning(
-                                    f"Episode deleted but failed to update Sonarr monitoring: {episode_label}"
-                                )
-
-                            logger.success(f"Episode deleted: {episode_label}")
-                            results["episodes_deleted"] += 1
 
-                        except Exception as e:
-                            error_msg = f"Error deleting episode {episode_label}: {e}"
-                            logger.error(error_msg)
-                            results["errors"].append(error_msg)
-                            results["episodes_failed"] += 1
-
-        # Delete movies
-        if self.radarr:
-            for movie_data in movies:
-                radarr_movie = movie_data["radarr_item"]
-                movie_id = radarr_movie.get("id")
-                movie_title = radarr_movie.get("title", "Unknown")
+            # Delete movies
+            if self.radarr:
+                for movie_data in movies:
+                    radarr_movie = movie_data["radarr_item"]
+                    movie_id = radarr_movie.get("id")
+                    movie_title = radarr_movie.get("title", "Unknown")
 
-                try:
                     if dry_run:
                         logger.info(
                             f"[DRY RUN] Would delete movie: {movie_title} (ID: {movie_id})"
                         )
                         results["movies_deleted"] += 1
                     else:
-                        success = self.radarr.delete_movie(
-                            movie_id, delete_files, add_exclusion
+                        submit(
+                            "radarr",
+                            "movies",
+                            self._delete_movie,
+                            movie_id,
+                            movie_title,
+                            delete_files,
+                            add_exclusion,
                         )
-                        if success:
-                            logger.success(f"Movie deleted: {movie_title}")
-                            results["movies_deleted"] += 1
-                        else:
-                            logger.failure(f"Movie deletion failed: {movie_title}")
-                            results["movies_failed"] += 1
-
-                except Exception as e:
-                    error_msg = f"Error deleting movie {movie_title}: {e}"
-                    logger.error(error_msg)
-                    results["errors"].append(error_msg)
-                    results["movies_failed"] += 1
 
-        # Delete series
-        if self.sonarr:
-            for series_data in series:
-                sonarr_series = series_data["sonarr_item"]
-                series_id = sonarr_series.get("id")
-                series_title = sonarr_series.get("title", "Unknown")
+            # Delete series
+            if self.sonarr:
+                for series_data in series:
+                    sonarr_series = series_data["sonarr_item"]
+                    series_id = sonarr_series.get("id")
+                    series_title = sonarr_series.get("title", "Unknown")
 
-                try:
                     if dry_run:
                         logger.info(
                             f"[DRY RUN] Would delete series: {series_title} (ID: {series_id})"
                         )
                         results["series_deleted"] += 1
                     else:
-                        success = self.sonarr.delete_series(
-                            series_id, delete_files, add_exclusion
+                        submit(
+                            "sonarr",
+                            "series",
+                            self._delete_series,
+                            series_id,
+                            series_title,
+                            delete_files,
+                            add_exclusion,
                         )
-                        if success:
-                            logger.success(f"Series deleted: {series_title}")
-                            results["series_deleted"] += 1
-                        else:
-                            logger.failure(f"Series deletion failed: {series_title}")
-                            results["series_failed"] += 1
 
-                except Exception as e:
-                    error_msg = f"Error deleting series {series_title}: {e}"
-                    logger.error(error_msg)
+            # Tally in submission order so errors are reported deterministically
+            for kind, future in pending:
+                deleted, error_msg = future.result()
+                results[f"{kind}_deleted" if deleted else f"{kind}_failed"] += 1
+                if error_msg:
                     results["errors"].append(error_msg)
-                    results["series_failed"] += 1
+        finally:
+            for executor in executors.values():
+                executor.shutdown()
 
         return results
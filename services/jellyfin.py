@@ -5,9 +5,8 @@ Jellyfin service for media management
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-import requests
-
 from utils import logger
+from utils.http import create_session, decode_json
 
 
 class JellyfinClient:
@@ -16,7 +15,7 @@ class JellyfinClient:
     def __init__(self, server_url: str, api_key: str):
         self.server_url = server_url.rstrip("/")
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update(
             {"X-Emby-Token": api_key, "Content-Type": "application/json"}
         )
@@ -32,16 +31,18 @@ class JellyfinClient:
         for base in possible_bases:
             try:
                 test_url = f"{self.server_url}{base}/Users/Me"
-                logger.api_debug("Jellyfin", f"Testing API base at: {test_url}")
+                logger.api_debug("Jellyfin", "Testing API base at: %s", test_url)
                 response = self.session.get(test_url, timeout=10)
-                logger.api_debug("Jellyfin", f"Response status: {response.status_code}")
+                logger.api_debug(
+                    "Jellyfin", "Response status: %s", response.status_code
+                )
                 if response.status_code == 200:
                     logger.api_debug(
-                        "Jellyfin", f"Found working API base: {base or 'root'}"
+                        "Jellyfin", "Found working API base: %s", base or "root"
                     )
                     return base
             except Exception as e:
-                logger.api_debug("Jellyfin", f"Failed to test {test_url}: {e}")
+                logger.api_debug("Jellyfin", "Failed to test %s: %s", test_url, e)
                 continue
 
         # Default to empty (root path) if detection fails
@@ -53,14 +54,14 @@ class JellyfinClient:
         url = f"{self.server_url}{self.api_base}/Users/Me"
         response = self.session.get(url)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def get_users(self) -> List[Dict[str, Any]]:
         """Get all users from Jellyfin server (requires admin privileges)"""
         url = f"{self.server_url}{self.api_base}/Users"
         response = self.session.get(url)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def get_watched_items(
         self, user_id: str, item_types: List[str] = None
@@ -74,13 +75,15 @@ class JellyfinClient:
             "IncludeItemTypes": ",".join(item_types),
             "Filters": "IsPlayed",
             "Recursive": "true",
-            "Fields": "Name,OriginalTitle,ProductionYear,Overview,Genres,RunTimeTicks,DateCreated,UserData",
+            "Fields": "Name,ProductionYear,UserData,ProviderIds",
+            "EnableImages": "false",
+            "EnableUserData": "true",
         }
 
         url = f"{self.server_url}{self.api_base}/Items"
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json().get("Items", [])
+        return decode_json(response).get("Items", [])
 
     def get_watched_episodes_for_series(
         self, user_id: str, series_id: str
@@ -92,13 +95,15 @@ class JellyfinClient:
             "IncludeItemTypes": "Episode",
             "Filters": "IsPlayed",
             "Recursive": "true",
-            "Fields": "Name,ParentIndexNumber,IndexNumber,SeasonName,Overview,RunTimeTicks,DateCreated,UserData",
+            "Fields": "Name,ParentIndexNumber,IndexNumber,UserData",
+            "EnableImages": "false",
+            "EnableUserData": "true",
         }
 
         url = f"{self.server_url}{self.api_base}/Items"
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json().get("Items", [])
+        return decode_json(response).get("Items", [])
 
     def get_favorite_episodes_for_series(
         self, user_id: str, series_id: str
@@ -111,12 +116,14 @@ class JellyfinClient:
             "Filters": "IsFavorite",
             "Recursive": "true",
             "Fields": "Name,ParentIndexNumber,IndexNumber,UserData",
+            "EnableImages": "false",
+            "EnableUserData": "true",
         }
 
         url = f"{self.server_url}{self.api_base}/Items"
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json().get("Items", [])
+        return decode_json(response).get("Items", [])
 
     def get_favorite_seasons_for_series(
         self, user_id: str, series_id: str
@@ -129,12 +136,14 @@ class JellyfinClient:
             "Filters": "IsFavorite",
             "Recursive": "false",
             "Fields": "Name,IndexNumber,UserData",
+            "EnableImages": "false",
+            "EnableUserData": "true",
         }
 
         url = f"{self.server_url}{self.api_base}/Items"
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json().get("Items", [])
+        return decode_json(response).get("Items", [])
 
     def format_runtime(self, runtime_ticks: int) -> str:
         """Convert runtime ticks to human readable format"""
@@ -194,7 +203,7 @@ class JellyfinClient:
         url = f"{self.server_url}{self.api_base}/Items"
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json().get("Items", [])
+        return decode_json(response).get("Items", [])
 
     def delete_item(self, item_id: str) -> bool:
         """Delete a media item (and its files)"""
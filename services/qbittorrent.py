@@ -3,12 +3,28 @@ qBittorrent service for torrent management
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import AbstractSet, Any, Dict, FrozenSet, List, Optional, Tuple
 
-import requests
 from requests.auth import HTTPBasicAuth
 
 from utils import logger
+from utils.http import create_session, decode_json
+
+# Torrent name normalization patterns, compiled once since every completed
+# torrent name goes through them. Years, release tags and edition tags are all
+# whole words, so removing them in one pass gives the same result as one pass
+# per group.
+_RE_TAGS = re.compile(
+    r"\b\d{4}\b"
+    r"|\b(?:1080p|720p|2160p|4K|HDR|x264|x265|h264|h265|HEVC|BluRay|WEB-DL|WEBRip|BDRip|HDTC|AMZN|ZEE5|WEB|DL|DUAL|Hindi|English|AAC|CineVood|mkv|mp4|avi)\b"
+    r"|\b(?:PROPER|REPACK|INTERNAL|LIMITED|EXTENDED|UNRATED|DIRECTORS|CUT|For|Justice)\b",
+    re.IGNORECASE,
+)
+# Brackets go before parentheses, which matters when the two interleave
+_RE_BRACKETS = re.compile(r"\[.*?\]")
+_RE_PARENS = re.compile(r"\(.*?\)")
+# Special characters become spaces and whitespace collapses, in a single pass
+_RE_NONWORD_RUN = re.compile(r"\W+")
 
 
 class QbittorrentClient:
@@ -25,11 +41,25 @@ class QbittorrentClient:
         self.username = username
         self.password = password
         self.use_basic_auth = use_basic_auth
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update(
             {"Content-Type": "application/x-www-form-urlencoded"}
         )
 
+        # Version seen by the last successful test_connection()
+        self._version: Optional[str] = None
+
+        # Completed torrents and lookup results, reused until clear_cache()
+        self._completed_torrents: Optional[List[Dict[str, Any]]] = None
+        self._media_index: Optional[
+            List[Tuple[Dict[str, Any], str, FrozenSet[str]]]
+        ] = None
+        self._token_index: Dict[str, List[int]] = {}
+        self._match_cache: Dict[Tuple[str, Optional[int], float], bool] = {}
+        # Normalized name and tokens by torrent hash; kept across clear_cache()
+        # since a torrent's name rarely changes, and checked against it on use
+        self._name_cache: Dict[str, Tuple[str, str, FrozenSet[str]]] = {}
+
         if use_basic_auth:
             logger.api_debug("qBittorrent", "Using HTTP Basic Auth")
             self.session.auth = HTTPBasicAuth(username, password)
@@ -47,7 +77,7 @@ class QbittorrentClient:
             login_url = f"{self.server_url}/api/v2/auth/login"
             data = {"username": self.username, "password": self.password}
 
-            logger.api_debug("qBittorrent", f"Logging in at {login_url}")
+            logger.api_debug("qBittorrent", "Logging in at %s", login_url)
             response = self.session.post(login_url, data=data)
 
             if response.status_code == 200 and response.text == "Ok.":
@@ -56,12 +86,14 @@ class QbittorrentClient:
             else:
                 logger.api_debug(
                     "qBittorrent",
-                    f"Session login failed: {response.status_code} - {response.text}",
+                    "Session login failed: %s - %s",
+                    response.status_code,
+                    response.text,
                 )
                 return False
 
         except Exception as e:
-            logger.api_debug("qBittorrent", f"Session login error: {e}")
+            logger.api_debug("qBittorrent", "Session login error: %s", e)
             return False
 
     def get_torrents(self, filter_status: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -74,12 +106,50 @@ class QbittorrentClient:
 
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def get_completed_torrents(self) -> List[Dict[str, Any]]:
         """Get only completed torrents"""
         return self.get_torrents(filter_status="completed")
 
+    def clear_cache(self):
+        """Forget cached completed torrents and match results"""
+        self._completed_torrents = None
+        self._media_index = None
+        self._token_index = {}
+        self._match_cache.clear()
+
+    def _get_cached_completed_torrents(self) -> List[Dict[str, Any]]:
+        """Get completed torrents, fetching them only once until clear_cache()"""
+        if self._completed_torrents is None:
+            self._completed_torrents = self.get_completed_torrents()
+        return self._completed_torrents
+
+    def build_media_index(self) -> List[Tuple[Dict[str, Any], str, FrozenSet[str]]]:
+        """Normalize and tokenize completed torrent names once until clear_cache()"""
+        if self._media_index is None:
+            # Rebuilt from the current torrents so removed ones drop out
+            old_cache, name_cache = self._name_cache, {}
+            index = []
+            for torrent in self._get_cached_completed_torrents():
+                name = torrent.get("name", "")
+                key = torrent.get("hash") or name
+                cached = old_cache.get(key)
+                if cached is None or cached[0] != name:
+                    normalized = self.normalize_title_for_matching(name)
+                    cached = (name, normalized, frozenset(normalized.split()))
+                name_cache[key] = cached
+                index.append((torrent, cached[1], cached[2]))
+            self._name_cache = name_cache
+            self._media_index = index
+            # Positions in the index of the torrents containing each token
+            token_index: Dict[str, List[int]] = {}
+            for position, (_, _, tokens) in enumerate(index):
+                for token in tokens:
+                    token_index.setdefault(token, []).append(position)
+            self._token_index = token_index
+        return self._media_index
+
     def get_torrent_files(self, torrent_hash: str) -> List[Dict[str, Any]]:
         """Get files for a specific torrent"""
         url = f"{self.server_url}/api/v2/torrents/files"
@@ -87,7 +157,7 @@ class QbittorrentClient:
 
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def normalize_title_for_matching(self, title: str) -> str:
         """Normalize torrent name for better matching with media titles"""
@@ -95,42 +165,39 @@ class QbittorrentClient:
         title = title.replace(".", " ")
 
         # Remove common torrent naming patterns
-        title = re.sub(r"\b\d{4}\b", "", title)  # Remove years
-        title = re.sub(
-            r"\b(1080p|720p|2160p|4K|HDR|x264|x265|h264|h265|HEVC|BluRay|WEB-DL|WEBRip|BDRip|HDTC|AMZN|ZEE5|WEB|DL|DUAL|Hindi|English|AAC|CineVood|mkv|mp4|avi)\b",
-            "",
-            title,
-            flags=re.IGNORECASE,
-        )
-        title = re.sub(
-            r"\b(PROPER|REPACK|INTERNAL|LIMITED|EXTENDED|UNRATED|DIRECTORS|CUT|For|Justice)\b",
-            "",
-            title,
-            flags=re.IGNORECASE,
-        )
-        title = re.sub(r"\[.*?\]", "", title)  # Remove brackets content
-        title = re.sub(r"\(.*?\)", "", title)  # Remove parentheses content
-        title = re.sub(r"[^\w\s]", " ", title)  # Replace special chars with spaces
-        title = re.sub(r"\s+", " ", title).strip().lower()  # Normalize whitespace
+        title = _RE_TAGS.sub("", title)  # Remove years and release/edition tags
+        title = _RE_BRACKETS.sub("", title)  # Remove brackets content
+        title = _RE_PARENS.sub("", title)  # Remove parentheses content
+        title = _RE_NONWORD_RUN.sub(" ", title).strip().lower()  # Normalize whitespace
         return title
 
     def find_matching_torrents(
         self, media_title: str, media_year: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Find torrents that might match a media title"""
-        completed_torrents = self.get_completed_torrents()
-        normalized_media = self.normalize_title_for_matching(media_title)
+        media_tokens = set(self.normalize_title_for_matching(media_title).split())
+        media_index = self.build_media_index()
+
+        # A torrent sharing no token scores at most the 0.2 year bonus, well
+        # under the threshold, so only torrents with a common token are scored
+        # (in index order, which decides ties)
+        token_index = self._token_index
+        positions = sorted(
+            {
+                position
+                for token in media_tokens
+                for position in token_index.get(token, ())
+            }
+        )
 
         matches = []
 
-        for torrent in completed_torrents:
+        for position in positions:
+            torrent, normalized_torrent, torrent_tokens = media_index[position]
             torrent_name = torrent.get("name", "")
-            normalized_torrent = self.normalize_title_for_matching(torrent_name)
 
             # Calculate similarity
-            similarity = self._calculate_similarity(
-                normalized_media, normalized_torrent
-            )
+            similarity = self._token_similarity(media_tokens, torrent_tokens)
 
             # Boost score if years match
             year_bonus = 0.0
@@ -153,18 +220,16 @@ class QbittorrentClient:
         matches.sort(key=lambda x: x["similarity_score"], reverse=True)
         return matches
 
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """Calculate similarity between two strings using simple token matching"""
-        tokens1 = set(str1.split())
-        tokens2 = set(str2.split())
-
+    def _token_similarity(
+        self, tokens1: AbstractSet[str], tokens2: AbstractSet[str]
+    ) -> float:
+        """Jaccard similarity of two token sets"""
         if not tokens1 or not tokens2:
             return 0.0
 
-        intersection = tokens1.intersection(tokens2)
-        union = tokens1.union(tokens2)
-
-        return len(intersection) / len(union) if union else 0.0
+        # |A | B| is |A| + |B| - |A & B|, so the union set is never built
+        common = len(tokens1 & tokens2)
+        return common / (len(tokens1) + len(tokens2) - common)
 
     def is_media_in_torrents(
         self,
@@ -173,19 +238,31 @@ class QbittorrentClient:
         min_similarity: float = 0.6,
     ) -> bool:
         """Check if media content exists in qBittorrent completed torrents"""
+        key = (media_title, media_year, min_similarity)
+        if key in self._match_cache:
+            return self._match_cache[key]
+
         matches = self.find_matching_torrents(media_title, media_year)
 
+        is_match = False
         if matches:
             best_match = matches[0]
             is_match = best_match["similarity_score"] >= min_similarity
             logger.api_debug(
                 "qBittorrent",
-                f"Match for '{media_title}': {best_match['torrent']['name']} (score: {best_match['similarity_score']:.2f}, threshold: {min_similarity})",
+                "Match for '%s': %s (score: %.2f, threshold: %s)",
+                media_title,
+                best_match["torrent"]["name"],
+                best_match["similarity_score"],
+                min_similarity,
+            )
+        else:
+            logger.api_debug(
+                "qBittorrent", "No torrent match found for '%s'", media_title
             )
-            return is_match
 
-        logger.api_debug("qBittorrent", f"No torrent match found for '{media_title}'")
-        return False
+        self._match_cache[key] = is_match
+        return is_match
 
     def get_torrent_properties(self, torrent_hash: str) -> Dict[str, Any]:
         """Get properties of a specific torrent"""
@@ -194,24 +271,31 @@ class QbittorrentClient:
 
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
+
+    def _fetch_version(self) -> str:
+        """Request the qBittorrent version string"""
+        url = f"{self.server_url}/api/v2/app/version"
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        return response.text.strip()
 
     def test_connection(self) -> bool:
         """Test connection to qBittorrent"""
         try:
-            # Try to get torrent list as a connection test
-            self.get_torrents()
+            # The version endpoint needs auth too but is tiny, unlike the
+            # torrent list; keep the answer for get_version()
+            self._version = self._fetch_version()
             return True
         except Exception as e:
-            logger.api_debug("qBittorrent", f"Connection test failed: {e}")
+            logger.api_debug("qBittorrent", "Connection test failed: %s", e)
             return False
 
     def get_version(self) -> str:
         """Get qBittorrent version"""
+        if self._version is not None:
+            return self._version
         try:
-            url = f"{self.server_url}/api/v2/app/version"
-            response = self.session.get(url)
-            response.raise_for_status()
-            return response.text.strip()
+            return self._fetch_version()
         except:
             return "Unknown"
@@ -4,10 +4,10 @@ Radarr service for movie management
 
 from typing import Any, Dict, List, Optional
 
-import requests
 from requests.auth import HTTPBasicAuth
 
 from utils import logger
+from utils.http import create_session, decode_json
 
 
 class RadarrClient:
@@ -22,7 +22,7 @@ class RadarrClient:
     ):
         self.server_url = server_url.rstrip("/")
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update(
             {"X-Api-Key": api_key, "Content-Type": "application/json"}
         )
@@ -36,7 +36,7 @@ class RadarrClient:
         url = f"{self.server_url}/api/v3/movie"
         response = self.session.get(url)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def get_movie_by_title(
         self, title: str, year: Optional[int] = None
@@ -85,39 +85,37 @@ class RadarrClient:
 
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get Radarr system status"""
         url = f"{self.server_url}/api/v3/system/status"
-        logger.api_debug("Radarr", f"Attempting to connect at: {url}")
-        response = self.session.get(url)
-        logger.api_debug("Radarr", f"Response status: {response.status_code}")
+        logger.api_debug("Radarr", "Attempting to connect at: %s", url)
+        response = self.session.get(url, timeout=10)
+        logger.api_debug("Radarr", "Response status: %s", response.status_code)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def test_connection(self) -> bool:
         """Test connection to Radarr"""
         try:
-            logger.api_debug("Radarr", f"Testing connection to {self.server_url}")
-            logger.api_debug(
-                "Radarr",
-                (
-                    f"Using API key: {self.api_key[:8]}..."
-                    if self.api_key
-                    else "No API key"
-                ),
-            )
+            logger.api_debug("Radarr", "Testing connection to %s", self.server_url)
+            if self.api_key:
+                logger.api_debug("Radarr", "Using API key: %s...", self.api_key[:8])
+            else:
+                logger.api_debug("Radarr", "No API key")
             logger.api_debug(
-                "Radarr", f"Using basic auth: {'Yes' if self.session.auth else 'No'}"
+                "Radarr", "Using basic auth: %s", "Yes" if self.session.auth else "No"
             )
 
             status = self.get_system_status()
-            logger.api_debug("Radarr", f"System status: {status}")
+            logger.api_debug("Radarr", "System status: %s", status)
 
             if "version" in status:
                 logger.api_debug(
-                    "Radarr", f"Connection successful, version: {status.get('version')}"
+                    "Radarr",
+                    "Connection successful, version: %s",
+                    status.get("version"),
                 )
                 return True
             else:
@@ -125,7 +123,7 @@ class RadarrClient:
                 return False
 
         except Exception as e:
-            logger.api_debug("Radarr", f"Connection failed: {type(e).__name__}: {e}")
+            logger.api_debug("Radarr", "Connection failed: %s: %s", type(e).__name__, e)
             return False
 
     def get_movie_by_id(self, movie_id: int) -> Optional[Dict[str, Any]]:
@@ -134,7 +132,7 @@ class RadarrClient:
             url = f"{self.server_url}/api/v3/movie/{movie_id}"
             response = self.session.get(url)
             response.raise_for_status()
-            return response.json()
+            return decode_json(response)
         except:
             return None
 
@@ -145,11 +143,11 @@ class RadarrClient:
 
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def get_queue(self) -> List[Dict[str, Any]]:
         """Get current download queue"""
         url = f"{self.server_url}/api/v3/queue"
         response = self.session.get(url)
         response.raise_for_status()
-        return response.json().get("records", [])
+        return decode_json(response).get("records", [])
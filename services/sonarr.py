@@ -2,12 +2,16 @@
 Sonarr service for TV series management
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
-import requests
 from requests.auth import HTTPBasicAuth
 
 from utils import logger
+from utils.http import create_session, decode_json
+
+# Concurrent episode list requests in are_series_fully_watched
+_MAX_EPISODE_WORKERS = 8
 
 
 class SonarrClient:
@@ -22,7 +26,7 @@ class SonarrClient:
     ):
         self.server_url = server_url.rstrip("/")
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update(
             {"X-Api-Key": api_key, "Content-Type": "application/json"}
         )
@@ -36,7 +40,7 @@ class SonarrClient:
         url = f"{self.server_url}/api/v3/series"
         response = self.session.get(url)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def get_series_by_title(
         self, title: str, year: Optional[int] = None
@@ -85,7 +89,7 @@ class SonarrClient:
 
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def set_episode_monitored_state(
         self, episode_ids: List[int], monitored: bool
@@ -112,56 +116,66 @@ class SonarrClient:
 
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def is_series_fully_watched(self, series_id: int) -> bool:
         """Check if all episodes in a series are monitored and downloaded"""
-        episodes = self.get_episodes(series_id)
-
-        # Get only monitored episodes that should be downloaded
-        monitored_episodes = [ep for ep in episodes if ep.get("monitored", False)]
-
-        if not monitored_episodes:
-            return False
-
-        # Check if all monitored episodes have files
-        for episode in monitored_episodes:
+        # Only monitored episodes should be downloaded; stop at the first one
+        # without a file
+        any_monitored = False
+        for episode in self.get_episodes(series_id):
+            if not episode.get("monitored", False):
+                continue
             if not episode.get("hasFile", False):
                 return False
-
-        return True
+            any_monitored = True
+
+        return any_monitored
+
+    def are_series_fully_watched(self, series_ids: List[int]) -> Dict[int, bool]:
+        """Run is_series_fully_watched for several series concurrently"""
+        unique_ids = list(dict.fromkeys(series_ids))
+        if len(unique_ids) <= 1:
+            return {
+                series_id: self.is_series_fully_watched(series_id)
+                for series_id in unique_ids
+            }
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_EPISODE_WORKERS, len(unique_ids))
+        ) as executor:
+            return dict(
+                zip(unique_ids, executor.map(self.is_series_fully_watched, unique_ids))
+            )
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get Sonarr system status"""
         url = f"{self.server_url}/api/v3/system/status"
-        logger.api_debug("Sonarr", f"Attempting to connect at: {url}")
-        response = self.session.get(url)
-        logger.api_debug("Sonarr", f"Response status: {response.status_code}")
+        logger.api_debug("Sonarr", "Attempting to connect at: %s", url)
+        response = self.session.get(url, timeout=10)
+        logger.api_debug("Sonarr", "Response status: %s", response.status_code)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def test_connection(self) -> bool:
         """Test connection to Sonarr"""
         try:
-            logger.api_debug("Sonarr", f"Testing connection to {self.server_url}")
-            logger.api_debug(
-                "Sonarr",
-                (
-                    f"Using API key: {self.api_key[:8]}..."
-                    if self.api_key
-                    else "No API key"
-                ),
-            )
+            logger.api_debug("Sonarr", "Testing connection to %s", self.server_url)
+            if self.api_key:
+                logger.api_debug("Sonarr", "Using API key: %s...", self.api_key[:8])
+            else:
+                logger.api_debug("Sonarr", "No API key")
             logger.api_debug(
-                "Sonarr", f"Using basic auth: {'Yes' if self.session.auth else 'No'}"
+                "Sonarr", "Using basic auth: %s", "Yes" if self.session.auth else "No"
             )
 
             status = self.get_system_status()
-            logger.api_debug("Sonarr", f"System status: {status}")
+            logger.api_debug("Sonarr", "System status: %s", status)
 
             if "version" in status:
                 logger.api_debug(
-                    "Sonarr", f"Connection successful, version: {status.get('version')}"
+                    "Sonarr",
+                    "Connection successful, version: %s",
+                    status.get("version"),
                 )
                 return True
             else:
@@ -169,7 +183,7 @@ class SonarrClient:
                 return False
 
         except Exception as e:
-            logger.api_debug("Sonarr", f"Connection failed: {type(e).__name__}: {e}")
+            logger.api_debug("Sonarr", "Connection failed: %s: %s", type(e).__name__, e)
             return False
 
     def get_series_by_id(self, series_id: int) -> Optional[Dict[str, Any]]:
@@ -178,7 +192,7 @@ class SonarrClient:
             url = f"{self.server_url}/api/v3/series/{series_id}"
             response = self.session.get(url)
             response.raise_for_status()
-            return response.json()
+            return decode_json(response)
         except:
             return None
 
@@ -189,11 +203,11 @@ class SonarrClient:
 
         response = self.session.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        return decode_json(response)
 
     def get_queue(self) -> List[Dict[str, Any]]:
         """Get current download queue"""
         url = f"{self.server_url}/api/v3/queue"
         response = self.session.get(url)
         response.raise_for_status()
-        return response.json().get("records", [])
+        return decode_json(response).get("records", [])
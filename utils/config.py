@@ -17,6 +17,7 @@ class Config:
             config_path or Path.home() / ".config" / "cleanarr" / "config.cfg"
         )
         self.config = configparser.ConfigParser()
+        self._sections: Dict[str, Dict[str, Any]] = {}
         self.load()
 
     def load(self) -> bool:
@@ -33,23 +34,24 @@ class Config:
 
         try:
             self.config.read(self.config_path)
+            self._sections.clear()
             return True
         except Exception as e:
             logger.error(f"Error reading config file {self.config_path}: {e}")
             return False
 
     def get_section(self, section: str) -> Dict[str, Any]:
-        """Get all values from a configuration section"""
-        if section in self.config:
-            return dict(self.config[section])
-        return {}
+        """Get all values from a configuration section (cached after first read)"""
+        cached = self._sections.get(section)
+        if cached is None:
+            cached = dict(self.config[section]) if section in self.config else {}
+            self._sections[section] = cached
+        return cached
 
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """Get a specific configuration value"""
-        try:
-            return self.config.get(section, key)
-        except (configparser.NoSectionError, configparser.NoOptionError):
-            return default
+        # Option names are stored lowercased, as configparser does on lookup
+        return self.get_section(section).get(key.lower(), default)
 
     def has_section(self, section: str) -> bool:
         """Check if configuration section exists"""
@@ -90,7 +92,22 @@ password = your_password
 
         # Reload the configuration after creating it
         self.config.read(self.config_path)
+        self._sections.clear()
+
+
+_config: Optional[Config] = None
+
+
+def get_config() -> Config:
+    """Get the global config instance, loading it on first use"""
+    global _config
+    if _config is None:
+        _config = Config()
+    return _config
 
 
-# Global config instance
-config = Config()
+def __getattr__(name: str) -> Any:
+    """Keep `from utils.config import config` working without import-time I/O"""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
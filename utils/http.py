@@ -0,0 +1,49 @@
+"""
+HTTP session helpers shared by the service clients
+"""
+
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Fall back to requests' stdlib json decoding
+    orjson = None
+
+# Enough keep-alive connections for the per-user and delete thread pools
+_POOL_SIZE = 16
+
+# Retry only gateway errors from a restarting server or reverse proxy, and
+# only for idempotent methods (urllib3's default allowed_methods). Refused
+# connections, timeouts and other errors such as TLS failures fail at once
+# so connection tests report quickly.
+_RETRY = Retry(
+    total=3,
+    connect=0,
+    read=0,
+    other=0,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False,
+)
+
+
+def create_session() -> requests.Session:
+    """Create a session with a larger connection pool and retries"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=_RETRY
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
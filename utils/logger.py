@@ -3,10 +3,25 @@ Logging configuration for Cleanarr
 """
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from typing import Optional
 
+# Log records buffered before they are written to the log file
+_FILE_LOG_BUFFER = 1024
+
+
+class _LazyFileHandler(logging.FileHandler):
+    """File handler that creates the log directory and file on first write"""
+
+    def __init__(self, filename: Path):
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
 
 class CleanarrLogger:
     """Custom logger for Cleanarr with file and console handlers"""
@@ -20,15 +35,15 @@ class CleanarrLogger:
 
     def _setup_logging(self):
         """Setup logging configuration"""
-        # Create log directory if it doesn't exist
-        self.log_file.parent.mkdir(parents=True, exist_ok=True)
-
         # Create root logger
         self.logger = logging.getLogger("cleanarr")
         self.logger.setLevel(getattr(logging, self.log_level))
 
-        # Clear any existing handlers
-        self.logger.handlers.clear()
+        # Remove any existing handlers, closing them so buffered records are
+        # written out
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
 
         # Console handler - only INFO and above, clean format
         console_handler = logging.StreamHandler(sys.stdout)
@@ -37,14 +52,24 @@ class CleanarrLogger:
         console_handler.setFormatter(console_formatter)
         self.logger.addHandler(console_handler)
 
-        # File handler - all levels, detailed format
-        file_handler = logging.FileHandler(self.log_file)
-        file_handler.setLevel(logging.DEBUG)
+        # File handler - all levels, detailed format. The log directory and
+        # file are only created once something is actually written
+        file_handler = _LazyFileHandler(self.log_file)
         file_formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
         )
         file_handler.setFormatter(file_formatter)
-        self.logger.addHandler(file_handler)
+
+        # Records reach the file in batches rather than one write per record;
+        # errors are written straight away, and logging's exit hook flushes the
+        # rest
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=_FILE_LOG_BUFFER,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+        )
+        buffered_handler.setLevel(logging.DEBUG)
+        self.logger.addHandler(buffered_handler)
 
         # Prevent propagation to root logger
         self.logger.propagate = False
@@ -73,18 +98,15 @@ def setup_logging(
 
 def get_logger() -> logging.Logger:
     """Get the global logger instance"""
-    global _logger
-
     if _logger is None:
-        _logger = setup_logging()
-
+        return setup_logging()
     return _logger
 
 
 # Convenience functions for common log levels
-def debug(message: str):
-    """Log debug message"""
-    get_logger().debug(message)
+def debug(message: str, *args):
+    """Log debug message; args are %-formatted only if it is emitted"""
+    get_logger().debug(message, *args)
 
 
 def info(message: str):
@@ -124,12 +146,14 @@ def progress(message: str):
 
 def config_info(message: str):
     """Log configuration info (debug level)"""
-    get_logger().debug(f"🔧 CONFIG: {message}")
+    logger = get_logger()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"🔧 CONFIG: {message}")
 
 
-def api_debug(service: str, message: str):
-    """Log API debug information"""
-    get_logger().debug(f"🌐 {service.upper()} API: {message}")
+def api_debug(service: str, message: str, *args):
+    """Log API debug information; args are %-formatted only if it is emitted"""
+    get_logger().debug("🌐 %s API: " + message, service.upper(), *args)
 
 
 def connection_success(service: str, message: str = ""):